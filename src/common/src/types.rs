@@ -2,6 +2,8 @@
 
 use serde::{Deserialize, Serialize};
 
+use crate::error::ArmouryError;
+
 /// CPU Performance modes available on ASUS laptops
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 pub enum PerformanceMode {
@@ -32,6 +34,27 @@ impl std::fmt::Display for PerformanceMode {
     }
 }
 
+impl std::str::FromStr for PerformanceMode {
+    type Err = ArmouryError;
+
+    /// Parse a mode name case-insensitively without allocating
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        const NAMES: [(&str, PerformanceMode); 5] = [
+            ("silent", PerformanceMode::Silent),
+            ("balanced", PerformanceMode::Balanced),
+            ("turbo", PerformanceMode::Turbo),
+            ("performance", PerformanceMode::Turbo),
+            ("manual", PerformanceMode::Manual),
+        ];
+
+        NAMES
+            .iter()
+            .find(|(name, _)| name.eq_ignore_ascii_case(s))
+            .map(|&(_, mode)| mode)
+            .ok_or_else(|| ArmouryError::InvalidValue(format!("Unknown performance mode: {}", s)))
+    }
+}
+
 /// GPU operation modes
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 pub enum GpuMode {
@@ -62,6 +85,26 @@ impl std::fmt::Display for GpuMode {
     }
 }
 
+impl std::str::FromStr for GpuMode {
+    type Err = ArmouryError;
+
+    /// Parse a mode name case-insensitively without allocating
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        const NAMES: [(&str, GpuMode); 4] = [
+            ("integrated", GpuMode::Integrated),
+            ("dedicated", GpuMode::Dedicated),
+            ("hybrid", GpuMode::Hybrid),
+            ("compute", GpuMode::Compute),
+        ];
+
+        NAMES
+            .iter()
+            .find(|(name, _)| name.eq_ignore_ascii_case(s))
+            .map(|&(_, mode)| mode)
+            .ok_or_else(|| ArmouryError::InvalidValue(format!("Unknown GPU mode: {}", s)))
+    }
+}
+
 /// Fan control mode
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 pub enum FanMode {
@@ -160,23 +203,32 @@ pub struct RgbColor {
 }
 
 impl RgbColor {
-    pub fn new(r: u8, g: u8, b: u8) -> Self {
+    /// Usable in `const` items, so fixed colours cost nothing at runtime
+    pub const fn new(r: u8, g: u8, b: u8) -> Self {
         Self { r, g, b }
     }
 
+    /// Parse "#RRGGBB" or "RRGGBB" as a single 24-bit value
     pub fn from_hex(hex: &str) -> Option<Self> {
         let hex = hex.trim_start_matches('#');
-        if hex.len() != 6 {
+        // from_str_radix would also take a leading '+'
+        if hex.len() != 6 || !hex.bytes().all(|b| b.is_ascii_hexdigit()) {
             return None;
         }
-        let r = u8::from_str_radix(&hex[0..2], 16).ok()?;
-        let g = u8::from_str_radix(&hex[2..4], 16).ok()?;
-        let b = u8::from_str_radix(&hex[4..6], 16).ok()?;
-        Some(Self { r, g, b })
+        let value = u32::from_str_radix(hex, 16).ok()?;
+        Some(Self::new((value >> 16) as u8, (value >> 8) as u8, value as u8))
     }
 
+    /// Format as uppercase "#RRGGBB"
     pub fn to_hex(&self) -> String {
-        format!("#{:02X}{:02X}{:02X}", self.r, self.g, self.b)
+        const DIGITS: &[u8; 16] = b"0123456789ABCDEF";
+        let mut hex = String::with_capacity(7);
+        hex.push('#');
+        for channel in [self.r, self.g, self.b] {
+            hex.push(DIGITS[(channel >> 4) as usize] as char);
+            hex.push(DIGITS[(channel & 0xF) as usize] as char);
+        }
+        hex
     }
 }
 
@@ -300,3 +352,69 @@ pub struct HardwareCapabilities {
     /// Model name if detected
     pub model_name: Option<String>,
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn performance_mode_from_str() {
+        assert_eq!("silent".parse::<PerformanceMode>().unwrap(), PerformanceMode::Silent);
+        assert_eq!("Balanced".parse::<PerformanceMode>().unwrap(), PerformanceMode::Balanced);
+        assert_eq!("TURBO".parse::<PerformanceMode>().unwrap(), PerformanceMode::Turbo);
+        assert_eq!("performance".parse::<PerformanceMode>().unwrap(), PerformanceMode::Turbo);
+        assert_eq!("Manual".parse::<PerformanceMode>().unwrap(), PerformanceMode::Manual);
+        assert!("ludicrous".parse::<PerformanceMode>().is_err());
+        assert!("".parse::<PerformanceMode>().is_err());
+    }
+
+    #[test]
+    fn performance_mode_display_round_trips() {
+        for mode in [
+            PerformanceMode::Silent,
+            PerformanceMode::Balanced,
+            PerformanceMode::Turbo,
+            PerformanceMode::Manual,
+        ] {
+            assert_eq!(mode.to_string().parse::<PerformanceMode>().unwrap(), mode);
+        }
+    }
+
+    #[test]
+    fn gpu_mode_from_str() {
+        assert_eq!("Hybrid".parse::<GpuMode>().unwrap(), GpuMode::Hybrid);
+        assert_eq!("integrated".parse::<GpuMode>().unwrap(), GpuMode::Integrated);
+        assert_eq!("DEDICATED".parse::<GpuMode>().unwrap(), GpuMode::Dedicated);
+        assert_eq!("compute".parse::<GpuMode>().unwrap(), GpuMode::Compute);
+        assert!("".parse::<GpuMode>().is_err());
+        assert!("hybrid ".parse::<GpuMode>().is_err());
+    }
+
+    #[test]
+    fn rgb_color_from_hex() {
+        let color = RgbColor::from_hex("#1a2B3c").unwrap();
+        assert_eq!((color.r, color.g, color.b), (0x1A, 0x2B, 0x3C));
+        let color = RgbColor::from_hex("00FF7f").unwrap();
+        assert_eq!((color.r, color.g, color.b), (0x00, 0xFF, 0x7F));
+
+        assert!(RgbColor::from_hex("#FF00").is_none());
+        assert!(RgbColor::from_hex("#FF000000").is_none());
+        assert!(RgbColor::from_hex("+FFFFF").is_none());
+        assert!(RgbColor::from_hex("GG0000").is_none());
+        assert!(RgbColor::from_hex("").is_none());
+    }
+
+    #[test]
+    fn rgb_color_hex_round_trips() {
+        for color in [
+            RgbColor::new(0, 0, 0),
+            RgbColor::new(0x12, 0xAB, 0xFF),
+            RgbColor::new(255, 255, 255),
+        ] {
+            let hex = color.to_hex();
+            let parsed = RgbColor::from_hex(&hex).unwrap();
+            assert_eq!((parsed.r, parsed.g, parsed.b), (color.r, color.g, color.b), "{}", hex);
+        }
+        assert_eq!(RgbColor::new(0x0A, 0xB0, 0x0C).to_hex(), "#0AB00C");
+    }
+}
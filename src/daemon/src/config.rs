@@ -3,8 +3,10 @@
 use anyhow::Result;
 use directories::ProjectDirs;
 use serde::{Deserialize, Serialize};
-use std::fs;
-use std::path::PathBuf;
+use std::fs::{self, File};
+use std::io::{self, Write};
+use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 
 /// Daemon configuration
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -39,16 +41,15 @@ impl Default for DaemonConfig {
 impl DaemonConfig {
     /// Load configuration from file or create default
     pub fn load() -> Result<Self> {
-        let config_path = Self::config_file_path();
-        
-        if config_path.exists() {
-            let content = fs::read_to_string(&config_path)?;
-            let config: DaemonConfig = serde_json::from_str(&content)?;
-            Ok(config)
-        } else {
-            let config = Self::default();
-            config.save()?;
-            Ok(config)
+        // Read directly; a missing file is the only case that needs a default
+        match fs::read(Self::config_file_path()) {
+            Ok(content) => Ok(serde_json::from_slice(&content)?),
+            Err(e) if e.kind() == io::ErrorKind::NotFound => {
+                let config = Self::default();
+                config.save()?;
+                Ok(config)
+            }
+            Err(e) => Err(e.into()),
         }
     }
 
@@ -61,14 +62,14 @@ impl DaemonConfig {
             fs::create_dir_all(parent)?;
         }
 
-        let content = serde_json::to_string_pretty(self)?;
-        fs::write(&config_path, content)?;
+        let content = serde_json::to_vec_pretty(self)?;
+        write_file_atomic(&config_path, &content)?;
         Ok(())
     }
 
     /// Get the configuration file path
     pub fn config_file_path() -> PathBuf {
-        if let Some(proj_dirs) = ProjectDirs::from("org", "asuslinux", "armoury") {
+        if let Some(proj_dirs) = project_dirs() {
             proj_dirs.config_dir().join("daemon.json")
         } else {
             PathBuf::from("/etc/asus-armoury/daemon.json")
@@ -77,10 +78,42 @@ impl DaemonConfig {
 
     /// Get the default profiles directory
     fn default_profiles_dir() -> PathBuf {
-        if let Some(proj_dirs) = ProjectDirs::from("org", "asuslinux", "armoury") {
+        if let Some(proj_dirs) = project_dirs() {
             proj_dirs.data_dir().join("profiles")
         } else {
             PathBuf::from("/var/lib/asus-armoury/profiles")
         }
     }
 }
+
+/// Per-user directories of the daemon, resolved once per process
+///
+/// Resolving them consults the environment and passwd database, so the
+/// config and profile paths share one lookup.
+fn project_dirs() -> Option<&'static ProjectDirs> {
+    static DIRS: OnceLock<Option<ProjectDirs>> = OnceLock::new();
+    DIRS.get_or_init(|| ProjectDirs::from("org", "asuslinux", "armoury")).as_ref()
+}
+
+/// Replace `path` with `contents` in one step
+///
+/// The data goes to a sibling temporary file that is flushed to disk and
+/// then renamed over `path`, so an interrupted save or a power loss leaves
+/// either the old file or the new one rather than a truncated one. The
+/// temporary file is removed if any step fails.
+pub(crate) fn write_file_atomic(path: &Path, contents: &[u8]) -> io::Result<()> {
+    let mut tmp_name = path.file_name().unwrap_or_default().to_os_string();
+    tmp_name.push(".tmp");
+    let tmp_path = path.with_file_name(tmp_name);
+
+    let result = (|| {
+        let mut file = File::create(&tmp_path)?;
+        file.write_all(contents)?;
+        file.sync_all()?;
+        fs::rename(&tmp_path, path)
+    })();
+    if result.is_err() {
+        let _ = fs::remove_file(&tmp_path);
+    }
+    result
+}
@@ -5,7 +5,8 @@ use asus_armoury_common::{
     FanCurve, FanCurvePoint, GpuMode, PerformanceMode, RgbEffect, RgbSettings, SystemStatus,
 };
 use log::{error, info};
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
+use std::time::Duration;
 use tokio::sync::RwLock;
 use zbus::{interface, Connection, ConnectionBuilder};
 
@@ -14,11 +15,16 @@ use crate::AppState;
 /// Main D-Bus interface for ASUS Armoury
 pub struct ArmouryInterface {
     state: Arc<RwLock<AppState>>,
+    /// Capabilities JSON, built on first request; detection is done at startup
+    capabilities_json: OnceLock<String>,
 }
 
 impl ArmouryInterface {
     pub fn new(state: Arc<RwLock<AppState>>) -> Self {
-        Self { state }
+        Self {
+            state,
+            capabilities_json: OnceLock::new(),
+        }
     }
 }
 
@@ -31,13 +37,27 @@ impl ArmouryInterface {
 
     /// Get hardware capabilities as JSON
     async fn get_capabilities(&self) -> String {
+        if let Some(json) = self.capabilities_json.get() {
+            return json.clone();
+        }
         let state = self.state.read().await;
-        serde_json::to_string(&state.hardware.capabilities).unwrap_or_default()
+        let json = serde_json::to_string(&state.hardware.capabilities).unwrap_or_default();
+        self.capabilities_json.get_or_init(|| json).clone()
     }
 
     /// Get system status as JSON
+    ///
+    /// Served from the monitoring task's latest sample while it is younger
+    /// than the configured poll interval; an older one (monitor backed off,
+    /// or no sample yet) is replaced by a live read.
     async fn get_system_status(&self) -> String {
         let state = self.state.read().await;
+        let max_age = Duration::from_millis(state.config.poll_interval_ms.max(1));
+        if let Some((taken, json)) = &state.status_json {
+            if taken.elapsed() < max_age {
+                return json.clone();
+            }
+        }
         let status = state.hardware.get_system_status();
         serde_json::to_string(&status).unwrap_or_default()
     }
@@ -52,15 +72,12 @@ impl ArmouryInterface {
 
     /// Set performance mode
     async fn set_performance_mode(&self, mode: &str) -> bool {
-        let mut state = self.state.write().await;
-        let mode = match mode.to_lowercase().as_str() {
-            "silent" => PerformanceMode::Silent,
-            "balanced" => PerformanceMode::Balanced,
-            "turbo" | "performance" => PerformanceMode::Turbo,
-            "manual" => PerformanceMode::Manual,
-            _ => return false,
+        let mode: PerformanceMode = match mode.parse() {
+            Ok(mode) => mode,
+            Err(_) => return false,
         };
-        
+
+        let mut state = self.state.write().await;
         match state.hardware.set_performance_mode(mode) {
             Ok(()) => true,
             Err(e) => {
@@ -80,15 +97,12 @@ impl ArmouryInterface {
 
     /// Set GPU mode
     async fn set_gpu_mode(&self, mode: &str) -> bool {
-        let mut state = self.state.write().await;
-        let mode = match mode.to_lowercase().as_str() {
-            "integrated" => GpuMode::Integrated,
-            "dedicated" => GpuMode::Dedicated,
-            "hybrid" => GpuMode::Hybrid,
-            "compute" => GpuMode::Compute,
-            _ => return false,
+        let mode: GpuMode = match mode.parse() {
+            Ok(mode) => mode,
+            Err(_) => return false,
         };
-        
+
+        let mut state = self.state.write().await;
         match state.hardware.set_gpu_mode(mode) {
             Ok(()) => true,
             Err(e) => {
@@ -100,13 +114,19 @@ impl ArmouryInterface {
 
     // ==================== Fan Control ====================
 
-    /// Get fan speeds as JSON { "cpu": rpm, "gpu": rpm }
+    /// Get fan speeds as JSON
     async fn get_fan_speeds(&self) -> String {
         let state = self.state.read().await;
         let (cpu, gpu) = state.hardware.get_fan_speeds();
         serde_json::json!({ "cpu": cpu, "gpu": gpu }).to_string()
     }
 
+    /// Get fan speeds as (cpu, gpu) RPM, without the JSON round trip
+    async fn get_fan_speeds_raw(&self) -> (u32, u32) {
+        let state = self.state.read().await;
+        state.hardware.get_fan_speeds()
+    }
+
     /// Set fan curve from JSON
     async fn set_fan_curve(&self, curve_json: &str) -> bool {
         let mut state = self.state.write().await;
@@ -142,13 +162,22 @@ impl ArmouryInterface {
 
     // ==================== Temperature ====================
 
-    /// Get temperatures as JSON { "cpu": temp, "gpu": temp }
+    /// Get temperatures as JSON
     async fn get_temperatures(&self) -> String {
         let state = self.state.read().await;
         let (cpu, gpu) = state.hardware.get_temperatures();
         serde_json::json!({ "cpu": cpu, "gpu": gpu }).to_string()
     }
 
+    /// Get temperatures as (cpu, gpu) degrees Celsius, without the JSON round trip
+    ///
+    /// D-Bus has no single-precision type, so the values are widened to f64.
+    async fn get_temperatures_raw(&self) -> (f64, f64) {
+        let state = self.state.read().await;
+        let (cpu, gpu) = state.hardware.get_temperatures();
+        (cpu as f64, gpu as f64)
+    }
+
     // ==================== RGB Keyboard ====================
 
     /// Get RGB settings as JSON
@@ -228,10 +257,13 @@ impl ArmouryInterface {
 
     /// Apply profile by name
     async fn apply_profile(&self, name: &str) -> bool {
-        let mut state = self.state.write().await;
-        
+        let mut guard = self.state.write().await;
+        // Reborrow so the profile can be borrowed from `profiles` while
+        // `hardware` is mutated, instead of cloning it on every apply
+        let state = &mut *guard;
+
         let profile = match state.profiles.get_profile(name) {
-            Some(p) => p.clone(),
+            Some(p) => p,
             None => {
                 error!("Profile not found: {}", name);
                 return false;
@@ -315,8 +347,8 @@ pub async fn run_server(state: Arc<RwLock<AppState>>) -> anyhow::Result<()> {
 
     info!("D-Bus server running at {} ({})", DBUS_NAME, DBUS_PATH);
 
-    // Keep the server running
-    loop {
-        tokio::time::sleep(tokio::time::Duration::from_secs(3600)).await;
-    }
+    // Serve until the caller drops this future; dropping it drops the
+    // connection and releases the bus name. Nothing here needs to wake up.
+    let _connection = connection;
+    std::future::pending().await
 }
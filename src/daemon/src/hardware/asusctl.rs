@@ -9,11 +9,7 @@ use std::process::Command;
 
 /// Check if asusctl is available on the system
 pub fn is_available() -> bool {
-    Command::new("asusctl")
-        .arg("--version")
-        .output()
-        .map(|o| o.status.success())
-        .unwrap_or(false)
+    super::find_executable("asusctl").is_some()
 }
 
 /// Set performance profile using asusctl
@@ -4,14 +4,24 @@ use asus_armoury_common::{
     ArmouryResult, FanCurve, GpuMode, HardwareCapabilities, PerformanceMode,
     RgbSettings, SystemStatus,
 };
-use log::{debug, info, warn};
-use std::fs;
-use std::path::Path;
+use log::{info, warn};
+use std::collections::HashMap;
+use std::path::PathBuf;
+use std::sync::{Mutex, OnceLock};
 
 mod sysfs;
 mod asusctl;
+mod uevent;
 
 pub use sysfs::SysfsInterface;
+pub use uevent::{PowerSupplyChange, PowerSupplyEvents};
+
+// Fixed sysfs nodes probed during capability detection
+const ASUS_WMI_PATH: &str = "/sys/devices/platform/asus-nb-wmi";
+const ANIME_MATRIX_PATH: &str = "/sys/devices/platform/asus-nb-wmi/anime_matrix";
+
+/// Charge limits accepted by `set_battery_limit`
+const VALID_BATTERY_LIMITS: [u8; 3] = [60, 80, 100];
 
 /// Main hardware controller managing all hardware interactions
 pub struct HardwareController {
@@ -23,6 +33,8 @@ pub struct HardwareController {
     current_performance_mode: PerformanceMode,
     /// Current GPU mode
     current_gpu_mode: GpuMode,
+    /// Last RGB settings applied to the keyboard
+    current_rgb_settings: RgbSettings,
 }
 
 impl HardwareController {
@@ -38,6 +50,7 @@ impl HardwareController {
             sysfs,
             current_performance_mode: PerformanceMode::Balanced,
             current_gpu_mode: GpuMode::Hybrid,
+            current_rgb_settings: RgbSettings::default(),
         })
     }
 
@@ -48,6 +61,7 @@ impl HardwareController {
             sysfs: SysfsInterface::new(),
             current_performance_mode: PerformanceMode::Balanced,
             current_gpu_mode: GpuMode::Hybrid,
+            current_rgb_settings: RgbSettings::default(),
         }
     }
 
@@ -59,37 +73,37 @@ impl HardwareController {
         caps.model_name = sysfs.read_model_name();
 
         // Check for ASUS WMI interface
-        let asus_wmi_exists = Path::new("/sys/devices/platform/asus-nb-wmi").exists();
-        
+        let asus_wmi_exists = sysfs::path_exists(ASUS_WMI_PATH);
+
         if asus_wmi_exists {
             info!("ASUS WMI interface detected");
-            
+
             // Check for platform_profile (performance modes)
-            caps.performance_modes = Path::new("/sys/firmware/acpi/platform_profile").exists();
-            
+            caps.performance_modes = sysfs::path_exists(sysfs::PLATFORM_PROFILE);
+
             // Check for fan control
             caps.fan_control = sysfs.has_fan_control();
-            
+
             // Check for battery charge limit
             caps.battery_limit = sysfs.has_battery_limit();
-            
+
             // Check for keyboard backlight/RGB
             caps.rgb_keyboard = sysfs.has_rgb_keyboard();
+
+            // Check for anime matrix (lives under the ASUS WMI device)
+            caps.anime_matrix = sysfs::path_exists(ANIME_MATRIX_PATH);
         }
 
         // Check for supergfxd (GPU switching)
         caps.gpu_switching = Self::check_supergfxd_available();
 
-        // Check for anime matrix
-        caps.anime_matrix = Path::new("/sys/devices/platform/asus-nb-wmi/anime_matrix").exists();
-
         caps
     }
 
     /// Check if supergfxd is available
     fn check_supergfxd_available() -> bool {
         // Check if supergfxd service exists
-        Path::new("/usr/bin/supergfxctl").exists()
+        find_executable("supergfxctl").is_some()
     }
 
     // ==================== Performance Mode ====================
@@ -137,13 +151,16 @@ impl HardwareController {
             GpuMode::Compute => "Compute",
         };
 
-        let output = std::process::Command::new("supergfxctl")
+        let supergfxctl = find_executable("supergfxctl").unwrap_or_else(|| "supergfxctl".into());
+        let output = std::process::Command::new(supergfxctl)
             .args(["-m", mode_str])
             .output();
 
         match output {
             Ok(out) if out.status.success() => {
                 self.current_gpu_mode = mode;
+                // The dGPU's hwmon node comes and goes with the mode
+                self.sysfs.rediscover_sensors();
                 info!("GPU mode set to: {}", mode);
                 Ok(())
             }
@@ -204,9 +221,11 @@ impl HardwareController {
     // ==================== RGB Keyboard ====================
 
     /// Get current RGB settings
+    ///
+    /// Served from the last successful `set_rgb_settings`; the keyboard has
+    /// no readable state for most of these fields.
     pub fn get_rgb_settings(&self) -> RgbSettings {
-        // TODO: Read from hardware
-        RgbSettings::default()
+        self.current_rgb_settings.clone()
     }
 
     /// Set RGB settings
@@ -218,6 +237,7 @@ impl HardwareController {
         }
 
         self.sysfs.write_rgb_settings(settings)?;
+        self.current_rgb_settings = settings.clone();
         info!("RGB settings applied: effect={}, brightness={}", settings.effect, settings.brightness);
         Ok(())
     }
@@ -238,8 +258,7 @@ impl HardwareController {
         }
 
         // Validate limit
-        let valid_limits = [60, 80, 100];
-        if !valid_limits.contains(&limit) {
+        if !VALID_BATTERY_LIMITS.contains(&limit) {
             return Err(asus_armoury_common::ArmouryError::InvalidValue(
                 format!("Invalid battery limit: {}. Valid values: 60, 80, 100", limit)
             ));
@@ -252,13 +271,29 @@ impl HardwareController {
 
     // ==================== System Status ====================
 
+    /// Serve AC state from memory between `power_supply_changed` calls
+    pub fn watch_power_supply_events(&self, watched: bool) {
+        self.sysfs.watch_power_supply_events(watched);
+    }
+
+    /// Invalidate cached power supply readings after a kernel uevent
+    ///
+    /// A supply being added or removed also drops the discovered battery and
+    /// adapter, so a late or hot-swapped one is picked up.
+    pub fn power_supply_changed(&self, change: PowerSupplyChange) {
+        match change {
+            PowerSupplyChange::Changed => self.sysfs.power_supply_changed(),
+            PowerSupplyChange::Hotplug => self.sysfs.power_supplies_hotplugged(),
+        }
+    }
+
     /// Get comprehensive system status
     pub fn get_system_status(&self) -> SystemStatus {
         let (cpu_temp, gpu_temp) = self.get_temperatures();
         let (cpu_fan, gpu_fan) = self.get_fan_speeds();
         let (cpu_usage, gpu_usage) = self.sysfs.read_cpu_gpu_usage();
-        let (battery_percent, ac_connected) = self.sysfs.read_battery_status();
-        let power_draw = self.sysfs.read_power_draw();
+        let battery = self.sysfs.read_battery();
+        let ac_connected = self.sysfs.read_ac_online();
 
         SystemStatus {
             cpu_temp,
@@ -267,9 +302,31 @@ impl HardwareController {
             gpu_usage,
             cpu_fan_rpm: cpu_fan,
             gpu_fan_rpm: gpu_fan,
-            battery_percent,
+            battery_percent: battery.capacity.unwrap_or(0),
             ac_connected,
-            power_draw,
+            power_draw: battery.power_draw_watts(),
         }
     }
 }
+
+/// Locate an executable on PATH, like `which`, without spawning anything
+///
+/// The PATH walk runs once per name for the process lifetime; every later
+/// lookup is answered from memory.
+pub(crate) fn find_executable(name: &'static str) -> Option<PathBuf> {
+    static CACHE: OnceLock<Mutex<HashMap<&'static str, Option<PathBuf>>>> = OnceLock::new();
+    let mut cache = CACHE
+        .get_or_init(|| Mutex::new(HashMap::new()))
+        .lock()
+        .unwrap_or_else(|e| e.into_inner());
+
+    cache
+        .entry(name)
+        .or_insert_with(|| {
+            let paths = std::env::var_os("PATH")?;
+            std::env::split_paths(&paths)
+                .map(|dir| dir.join(name))
+                .find(|candidate| candidate.is_file())
+        })
+        .clone()
+}
@@ -4,70 +4,466 @@
 
 use asus_armoury_common::{ArmouryResult, ArmouryError, FanCurve, PerformanceMode, RgbSettings};
 use log::{debug, warn};
+use std::collections::HashMap;
+use std::fmt::Write as _;
 use std::fs;
-use std::path::Path;
+use std::io::Read;
+use std::os::unix::fs::{FileExt, OpenOptionsExt};
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::{Duration, Instant};
 
 // ASUS-specific sysfs paths
-const PLATFORM_PROFILE: &str = "/sys/firmware/acpi/platform_profile";
+pub const PLATFORM_PROFILE: &str = "/sys/firmware/acpi/platform_profile";
 const PLATFORM_PROFILE_CHOICES: &str = "/sys/firmware/acpi/platform_profile_choices";
 const ASUS_WMI_PATH: &str = "/sys/devices/platform/asus-nb-wmi";
+const FAN_CURVE_PATH: &str = "/sys/devices/platform/asus-nb-wmi/fan_curve";
+const ASUS_WMI_LEDS_PATH: &str = "/sys/devices/platform/asus-nb-wmi/leds";
+const KBD_BACKLIGHT_PATH: &str = "/sys/class/leds/asus::kbd_backlight";
+const KBD_BACKLIGHT_BRIGHTNESS: &str = "/sys/class/leds/asus::kbd_backlight/brightness";
+const TUF_KBD_BACKLIGHT_PATH: &str = "/sys/devices/platform/asus-nb-wmi/leds/asus::kbd_backlight";
 const BATTERY_LIMIT_PATH: &str = "/sys/class/power_supply/BAT0/charge_control_end_threshold";
 const BATTERY_LIMIT_PATH_ALT: &str = "/sys/class/power_supply/BAT1/charge_control_end_threshold";
+const POWER_SUPPLY_PATH: &str = "/sys/class/power_supply";
+
+/// Numeric battery attributes read on every battery poll
+const BATTERY_ATTRS: [&str; 3] = ["capacity", "power_now", "charge_control_end_threshold"];
+
+/// Attributes only needed to estimate power draw when `power_now` is missing
+const BATTERY_FALLBACK_ATTRS: [&str; 2] = ["energy_now", "voltage_now"];
+
+/// How long a battery snapshot is served from memory before re-reading sysfs
+const BATTERY_CACHE_TTL: Duration = Duration::from_millis(500);
+
+/// Shortest /proc/stat window, in jiffies summed over all CPUs, worth
+/// turning into a CPU usage figure
+const MIN_CPU_USAGE_WINDOW_JIFFIES: u64 = 50;
+
+/// How long a scan that left a sensor role unfilled is trusted before retrying
+const INCOMPLETE_RESCAN_INTERVAL: Duration = Duration::from_secs(30);
+
+// Kernel CPU time accounting
+const PROC_STAT: &str = "/proc/stat";
 
 // Thermal zone paths for temperature reading
 const THERMAL_ZONE_BASE: &str = "/sys/class/thermal/thermal_zone";
 const HWMON_PATH: &str = "/sys/class/hwmon";
+const DRM_GPU_BUSY_PATH: &str = "/sys/class/drm/card0/device/gpu_busy_percent";
+
+// Thermal zone type substrings identifying CPU and GPU sensors
+const CPU_ZONE_MARKERS: [&str; 2] = ["cpu", "x86_pkg"];
+const GPU_ZONE_MARKERS: [&str; 1] = ["gpu"]; // also covers "amdgpu"
+
+// hwmon driver name substrings for each sensor role
+const CPU_HWMON_NAMES: [&str; 4] = ["coretemp", "k10temp", "zenpower", "acpitz"];
+const GPU_HWMON_NAMES: [&str; 4] = ["nvidia", "amdgpu", "nouveau", "radeon"];
+const FAN_HWMON_NAMES: [&str; 3] = ["asus-nb-wmi", "asus_fan", "thinkpad"];
+
+/// Battery attributes gathered in a single batched read
+#[derive(Debug, Clone, Copy, Default)]
+pub struct BatteryReadings {
+    /// Charge percentage
+    pub capacity: Option<u8>,
+    /// Current power draw (microwatts)
+    pub power_now: Option<u64>,
+    /// Remaining energy (microwatt-hours)
+    pub energy_now: Option<u64>,
+    /// Current voltage (microvolts)
+    pub voltage_now: Option<u64>,
+    /// Charge limit percentage
+    pub charge_limit: Option<u8>,
+}
+
+impl BatteryReadings {
+    /// Power draw in watts
+    pub fn power_draw_watts(&self) -> f32 {
+        if let Some(power) = self.power_now {
+            return (power as f64 / 1_000_000.0) as f32; // Convert to watts
+        }
+
+        // This is approximate - actual power draw requires time delta
+        match (self.energy_now, self.voltage_now) {
+            (Some(energy), Some(voltage)) => ((energy as f64 * voltage as f64) / 1e12) as f32,
+            _ => 0.0,
+        }
+    }
+}
+
+/// Power supply nodes located by scanning /sys/class/power_supply
+#[derive(Debug)]
+struct PowerSupplies {
+    /// Kept-open attributes of the system battery (BAT0, BAT1, ...)
+    battery_inputs: Option<BatteryInputs>,
+    /// Whether the battery limit file sits in the battery directory and is read in its batch
+    battery_limit_in_batch: bool,
+    /// Kept-open `online` attribute of the mains adapter (AC0, ADP1, ...)
+    ac_online_input: Option<fs::File>,
+}
+
+impl PowerSupplies {
+    fn discover(battery_limit_path: Option<&str>) -> Self {
+        let (battery_dir, ac_online_path) = discover_power_supplies();
+        let battery_limit_in_batch = match (&battery_dir, battery_limit_path) {
+            (Some(dir), Some(path)) => Path::new(path).parent() == Some(dir.as_path()),
+            _ => false,
+        };
+        let battery_inputs = battery_dir.map(|dir| BatteryInputs {
+            attrs: BATTERY_ATTRS.map(|attr| open_sysfs_reader(dir.join(attr))),
+            fallback_attrs: BATTERY_FALLBACK_ATTRS.map(|attr| open_sysfs_reader(dir.join(attr))),
+        });
+
+        Self {
+            battery_inputs,
+            battery_limit_in_batch,
+            ac_online_input: ac_online_path.and_then(open_sysfs_reader),
+        }
+    }
+}
+
+impl Discovery for PowerSupplies {
+    fn is_complete(&self) -> bool {
+        self.battery_inputs.is_some() && self.ac_online_input.is_some()
+    }
+}
+
+/// Battery attributes, opened once at discovery and re-read with pread
+#[derive(Debug)]
+struct BatteryInputs {
+    /// Handles for `BATTERY_ATTRS`
+    attrs: [Option<fs::File>; BATTERY_ATTRS.len()],
+    /// Handles for `BATTERY_FALLBACK_ATTRS`
+    fallback_attrs: [Option<fs::File>; BATTERY_FALLBACK_ATTRS.len()],
+}
+
+/// hwmon devices for each sensor role and the attributes polled from them
+#[derive(Debug, Default)]
+struct HwmonDevices {
+    cpu: Option<PathBuf>,
+    gpu: Option<PathBuf>,
+    fan: Option<PathBuf>,
+    // Polled attributes of the devices above, kept open and re-read with pread
+    /// `temp1_input` of the CPU device
+    cpu_temp_input: Option<fs::File>,
+    /// `temp1_input` of the GPU device
+    gpu_temp_input: Option<fs::File>,
+    /// `gpu_busy_percent` of the GPU device
+    gpu_busy_input: Option<fs::File>,
+    /// `gpu_busy_percent` of DRM card0, the fallback when the hwmon one is missing
+    drm_busy_input: Option<fs::File>,
+    /// `fan1_input`/`fan2_input` of the fan device
+    fan_inputs: [Option<fs::File>; 2],
+}
+
+impl HwmonDevices {
+    /// Classify every hwmon device in one scan of /sys/class/hwmon
+    ///
+    /// The first device whose driver name matches a role's name table wins
+    /// that role.
+    fn discover() -> Self {
+        let mut devices = Self::default();
+        // read_dir fails the same way a missing class dir would; no separate stat
+        let entries = match fs::read_dir(HWMON_PATH) {
+            Ok(entries) => entries,
+            Err(_) => return devices,
+        };
+
+        // Driver names are short; read each into a stack buffer, not a String
+        let mut buf = [0u8; 64];
+        for entry in entries.flatten() {
+            if devices.cpu.is_some() && devices.gpu.is_some() && devices.fan.is_some() {
+                break;
+            }
+
+            let path = entry.path();
+            let len = match fs::File::open(path.join("name")).and_then(|mut f| f.read(&mut buf)) {
+                Ok(len) => len,
+                Err(_) => continue,
+            };
+            let name = &mut buf[..len];
+            name.make_ascii_lowercase();
+            let name = std::str::from_utf8(name).unwrap_or("").trim();
+
+            for (slot, names) in [
+                (&mut devices.cpu, &CPU_HWMON_NAMES[..]),
+                (&mut devices.gpu, &GPU_HWMON_NAMES[..]),
+                (&mut devices.fan, &FAN_HWMON_NAMES[..]),
+            ] {
+                if slot.is_none() && names.iter().any(|n| name.contains(n)) {
+                    *slot = Some(path.clone());
+                }
+            }
+        }
+
+        if let Some(cpu) = &devices.cpu {
+            devices.cpu_temp_input = open_sysfs_reader(cpu.join("temp1_input"));
+        }
+        if let Some(gpu) = &devices.gpu {
+            devices.gpu_temp_input = open_sysfs_reader(gpu.join("temp1_input"));
+            devices.gpu_busy_input = open_sysfs_reader(gpu.join("gpu_busy_percent"));
+        }
+        devices.drm_busy_input = open_sysfs_reader(DRM_GPU_BUSY_PATH);
+        if let Some(fan) = &devices.fan {
+            devices.fan_inputs =
+                ["fan1_input", "fan2_input"].map(|input| open_sysfs_reader(fan.join(input)));
+        }
+
+        debug!("hwmon devices: {:?}", devices);
+        devices
+    }
+}
+
+impl Discovery for HwmonDevices {
+    fn is_complete(&self) -> bool {
+        self.cpu.is_some() && self.gpu.is_some() && self.fan.is_some()
+    }
+}
+
+/// CPU and GPU thermal zones, classified by their type
+#[derive(Debug, Default)]
+struct ThermalZones {
+    /// Kept-open `temp` of the first CPU zone
+    cpu_temp_input: Option<fs::File>,
+    /// Kept-open `temp` of the first GPU zone
+    gpu_temp_input: Option<fs::File>,
+}
+
+impl ThermalZones {
+    /// Match each zone's type against the CPU and GPU markers
+    ///
+    /// Like hwmon discovery, zone types are read into a stack buffer, and
+    /// one path buffer is reused for every zone's `type` and `temp`.
+    fn discover() -> Self {
+        let mut zones = Self::default();
+        let mut path = String::with_capacity(THERMAL_ZONE_BASE.len() + 8);
+        let mut buf = [0u8; 64];
+
+        for i in 0..20 {
+            if zones.cpu_temp_input.is_some() && zones.gpu_temp_input.is_some() {
+                break;
+            }
+
+            path.clear();
+            let _ = write!(path, "{}{}/", THERMAL_ZONE_BASE, i);
+            let zone_len = path.len();
+            path.push_str("type");
+            let len = match fs::File::open(&path).and_then(|mut f| f.read(&mut buf)) {
+                Ok(len) => len,
+                Err(_) => continue,
+            };
+            let zone_type = &mut buf[..len];
+            zone_type.make_ascii_lowercase();
+            let zone_type = std::str::from_utf8(zone_type).unwrap_or("").trim();
+
+            let is_cpu = zones.cpu_temp_input.is_none()
+                && (zone_type == "acpitz"
+                    || CPU_ZONE_MARKERS.iter().any(|m| zone_type.contains(m)));
+            let is_gpu = zones.gpu_temp_input.is_none()
+                && GPU_ZONE_MARKERS.iter().any(|m| zone_type.contains(m));
+            if !is_cpu && !is_gpu {
+                continue;
+            }
+
+            path.truncate(zone_len);
+            path.push_str("temp");
+            if is_cpu {
+                zones.cpu_temp_input = open_sysfs_reader(&path);
+            }
+            if is_gpu {
+                zones.gpu_temp_input = open_sysfs_reader(&path);
+            }
+        }
+
+        debug!("Thermal zones: {:?}", zones);
+        zones
+    }
+}
+
+impl Discovery for ThermalZones {
+    fn is_complete(&self) -> bool {
+        self.cpu_temp_input.is_some() && self.gpu_temp_input.is_some()
+    }
+}
+
+/// Result of scanning sysfs for the nodes backing a set of sensor roles
+trait Discovery {
+    /// Whether every role found a node; incomplete scans are retried after
+    /// `INCOMPLETE_RESCAN_INTERVAL` in case a driver registers late
+    fn is_complete(&self) -> bool;
+}
+
+/// Lazily discovered sysfs nodes that can be dropped and scanned again
+///
+/// Kept-open handles die with their node when a driver is reloaded or a
+/// device is powered off (e.g. a dGPU across a GPU mode switch). Dropping
+/// the discovery makes the next access scan again rather than read a dead
+/// handle for the rest of the process.
+#[derive(Debug)]
+struct Rediscoverable<T> {
+    current: Mutex<Option<(Instant, Arc<T>)>>,
+}
+
+impl<T: Discovery> Rediscoverable<T> {
+    fn new() -> Self {
+        Self {
+            current: Mutex::new(None),
+        }
+    }
+
+    /// Current discovery, running `discover` first if there is none
+    fn get(&self, discover: impl FnOnce() -> T) -> Arc<T> {
+        let mut current = self.current.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some((scanned, nodes)) = current.as_ref() {
+            if nodes.is_complete() || scanned.elapsed() < INCOMPLETE_RESCAN_INTERVAL {
+                return Arc::clone(nodes);
+            }
+        }
+
+        let nodes = Arc::new(discover());
+        *current = Some((Instant::now(), Arc::clone(&nodes)));
+        nodes
+    }
+
+    /// Drop the discovery so the next access scans again
+    fn invalidate(&self) {
+        *self.current.lock().unwrap_or_else(|e| e.into_inner()) = None;
+    }
+
+    /// Drop `stale` unless a newer discovery has already replaced it
+    fn invalidate_stale(&self, stale: &Arc<T>) {
+        let mut current = self.current.lock().unwrap_or_else(|e| e.into_inner());
+        if current.as_ref().is_some_and(|(_, nodes)| Arc::ptr_eq(nodes, stale)) {
+            *current = None;
+        }
+    }
+
+    /// Read a kept-open numeric attribute picked out of the discovery
+    fn read(&self, discover: impl Fn() -> T, input: impl Fn(&T) -> Option<&fs::File>) -> Option<i64> {
+        self.read_with(discover, |nodes| input(nodes).map_or(Ok(None), read_kept_open_int))
+    }
+
+    /// Run `read` against the discovery's kept-open handles
+    ///
+    /// A stale handle drops the discovery and the read is retried once on a
+    /// fresh scan, so a node that went away and came back is found again.
+    fn read_with<R>(
+        &self,
+        discover: impl Fn() -> T,
+        read: impl Fn(&T) -> Result<Option<R>, StaleHandle>,
+    ) -> Option<R> {
+        for _ in 0..2 {
+            let nodes = self.get(&discover);
+            match read(&nodes) {
+                Ok(value) => return value,
+                Err(StaleHandle) => {
+                    debug!("Kept-open sysfs handle went stale, scanning again");
+                    self.invalidate_stale(&nodes);
+                }
+            }
+        }
+        None
+    }
+}
+
+/// Process-wide cache of existence checks for fixed sysfs paths
+fn path_cache() -> &'static Mutex<HashMap<&'static str, bool>> {
+    static CACHE: OnceLock<Mutex<HashMap<&'static str, bool>>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(HashMap::new()))
+}
+
+/// Check whether a fixed sysfs path exists, remembering the answer
+///
+/// Platform nodes rarely come and go on a running system, so each path is
+/// only stat'ed once until `invalidate_path_cache` runs on a hotplug.
+pub fn path_exists(path: &'static str) -> bool {
+    let mut cache = path_cache().lock().unwrap_or_else(|e| e.into_inner());
+    *cache.entry(path).or_insert_with(|| Path::new(path).exists())
+}
+
+/// Return the first candidate path that exists
+pub fn resolve_first_existing(candidates: &[&'static str]) -> Option<&'static str> {
+    candidates.iter().copied().find(|path| path_exists(path))
+}
+
+/// Forget all cached path lookups after a hotplug event
+///
+/// Called from `SysfsInterface::rediscover_sensors` and on power supply
+/// add/remove, so a node that registered late (e.g. `asus::kbd_backlight`)
+/// is not reported missing for good.
+fn invalidate_path_cache() {
+    path_cache().lock().unwrap_or_else(|e| e.into_inner()).clear();
+}
 
 /// Interface for reading/writing sysfs values
 pub struct SysfsInterface {
     /// Cached battery limit path (BAT0 or BAT1)
-    battery_limit_path: Option<String>,
+    battery_limit_path: Option<&'static str>,
+    /// Laptop model name, read on first use
+    model_name: OnceLock<Option<String>>,
+    /// Battery and AC adapter paths, discovered on first use
+    power_supplies: Rediscoverable<PowerSupplies>,
+    /// CPU, GPU and fan hwmon devices, discovered on first use
+    hwmon_devices: Rediscoverable<HwmonDevices>,
+    /// CPU and GPU thermal zones, classified on first use
+    thermal_zones: Rediscoverable<ThermalZones>,
+    /// Persistent handle on /proc/stat, re-read with pread on every poll
+    proc_stat: Option<fs::File>,
+    /// Previous CPU jiffies and usage for delta-based usage
+    last_cpu_times: Mutex<CpuTimes>,
+    /// Most recent battery snapshot and when it was taken
+    battery_cache: Mutex<Option<(Instant, BatteryReadings)>>,
+    /// Last AC adapter state, only trusted while uevents are watched
+    ac_online_cache: Mutex<Option<bool>>,
+    /// Set once power_supply uevents are reported via `power_supply_changed`
+    power_supply_events: AtomicBool,
+    /// Pre-opened write handle for platform_profile
+    platform_profile_writer: SysfsWriter,
+    /// Pre-opened write handle for the battery charge threshold
+    battery_limit_writer: SysfsWriter,
+    /// Pre-opened write handle for the ASUS WMI fan curve
+    fan_curve_writer: SysfsWriter,
+    /// Pre-opened write handle for the keyboard backlight brightness
+    kbd_brightness_writer: SysfsWriter,
 }
 
 impl SysfsInterface {
     pub fn new() -> Self {
-        // Determine which battery path exists
-        let battery_limit_path = if Path::new(BATTERY_LIMIT_PATH).exists() {
-            Some(BATTERY_LIMIT_PATH.to_string())
-        } else if Path::new(BATTERY_LIMIT_PATH_ALT).exists() {
-            Some(BATTERY_LIMIT_PATH_ALT.to_string())
-        } else {
-            None
-        };
+        // Determine which battery paths exist
+        let battery_limit_path = resolve_first_existing(&[BATTERY_LIMIT_PATH, BATTERY_LIMIT_PATH_ALT]);
 
-        Self { battery_limit_path }
+        Self {
+            battery_limit_path,
+            model_name: OnceLock::new(),
+            power_supplies: Rediscoverable::new(),
+            hwmon_devices: Rediscoverable::new(),
+            thermal_zones: Rediscoverable::new(),
+            proc_stat: fs::File::open(PROC_STAT).ok(),
+            last_cpu_times: Mutex::new(CpuTimes::default()),
+            battery_cache: Mutex::new(None),
+            ac_online_cache: Mutex::new(None),
+            power_supply_events: AtomicBool::new(false),
+            platform_profile_writer: SysfsWriter::new(open_sysfs_writer(PLATFORM_PROFILE)),
+            battery_limit_writer: SysfsWriter::new(battery_limit_path.and_then(open_sysfs_writer)),
+            fan_curve_writer: SysfsWriter::new(open_sysfs_writer(FAN_CURVE_PATH)),
+            kbd_brightness_writer: SysfsWriter::new(open_sysfs_writer(KBD_BACKLIGHT_BRIGHTNESS)),
+        }
     }
 
     // ==================== Model Detection ====================
 
     /// Read the laptop model name
+    ///
+    /// DMI and WMI identity never change at runtime, so the files are read
+    /// on the first call only.
     pub fn read_model_name(&self) -> Option<String> {
-        // Try DMI product name
-        if let Ok(name) = fs::read_to_string("/sys/class/dmi/id/product_name") {
-            let name = name.trim().to_string();
-            if !name.is_empty() {
-                return Some(name);
-            }
-        }
-        
-        // Try ASUS WMI
-        let wmi_path = format!("{}/product_name", ASUS_WMI_PATH);
-        if let Ok(name) = fs::read_to_string(&wmi_path) {
-            let name = name.trim().to_string();
-            if !name.is_empty() {
-                return Some(name);
-            }
-        }
-
-        None
+        self.model_name.get_or_init(read_model_name_uncached).clone()
     }
 
     // ==================== Capability Detection ====================
 
     /// Check if fan control is available
     pub fn has_fan_control(&self) -> bool {
-        let fan_curve_path = format!("{}/fan_curve", ASUS_WMI_PATH);
-        Path::new(&fan_curve_path).exists() || self.find_hwmon_fan().is_some()
+        path_exists(FAN_CURVE_PATH) || self.hwmon_devices().fan.is_some()
     }
 
     /// Check if battery limit control is available
@@ -77,21 +473,9 @@ impl SysfsInterface {
 
     /// Check if RGB keyboard control is available
     pub fn has_rgb_keyboard(&self) -> bool {
-        // Check for ASUS keyboard backlight
-        let kbd_backlight = "/sys/class/leds/asus::kbd_backlight";
-        if Path::new(kbd_backlight).exists() {
-            return true;
-        }
-
-        // Check for aura_keyboard
-        let aura_path = format!("{}/leds", ASUS_WMI_PATH);
-        if Path::new(&aura_path).exists() {
-            return true;
-        }
-
-        // Check for TUF RGB
-        let tuf_rgb = "/sys/devices/platform/asus-nb-wmi/leds/asus::kbd_backlight";
-        Path::new(tuf_rgb).exists()
+        // Check for ASUS keyboard backlight, aura_keyboard, then TUF RGB
+        resolve_first_existing(&[KBD_BACKLIGHT_PATH, ASUS_WMI_LEDS_PATH, TUF_KBD_BACKLIGHT_PATH])
+            .is_some()
     }
 
     // ==================== Platform Profile ====================
@@ -100,103 +484,45 @@ impl SysfsInterface {
     pub fn read_platform_profile(&self) -> Option<PerformanceMode> {
         let content = fs::read_to_string(PLATFORM_PROFILE).ok()?;
         let profile = content.trim();
-        
-        match profile {
-            "quiet" | "silent" => Some(PerformanceMode::Silent),
-            "balanced" | "balanced-performance" => Some(PerformanceMode::Balanced),
-            "performance" | "turbo" => Some(PerformanceMode::Turbo),
-            _ => {
-                warn!("Unknown platform profile: {}", profile);
-                None
-            }
+
+        let mode = parse_platform_profile(profile);
+        if mode.is_none() {
+            warn!("Unknown platform profile: {}", profile);
         }
+        mode
     }
 
     /// Write platform profile (performance mode)
     pub fn write_platform_profile(&self, mode: PerformanceMode) -> ArmouryResult<()> {
-        let profile = match mode {
-            PerformanceMode::Silent => "quiet",
-            PerformanceMode::Balanced => "balanced",
-            PerformanceMode::Turbo => "performance",
-            PerformanceMode::Manual => "balanced", // Manual uses balanced as base
-        };
-
-        fs::write(PLATFORM_PROFILE, profile).map_err(|e| {
-            if e.kind() == std::io::ErrorKind::PermissionDenied {
-                ArmouryError::PermissionDenied("Cannot write platform profile (root required)".to_string())
-            } else {
-                ArmouryError::IoError(e)
-            }
-        })
+        self.platform_profile_writer
+            .write(PLATFORM_PROFILE, platform_profile_name(mode))
+            .map_err(|e| {
+                if e.kind() == std::io::ErrorKind::PermissionDenied {
+                    ArmouryError::PermissionDenied("Cannot write platform profile (root required)".to_string())
+                } else {
+                    ArmouryError::IoError(e)
+                }
+            })
     }
 
     // ==================== Temperature Reading ====================
 
     /// Read CPU and GPU temperatures
+    ///
+    /// The CPU prefers its thermal zone over hwmon, the GPU the other way
+    /// round; each poll only re-reads the already classified `temp` inputs.
+    /// Readings stay integer millidegrees until they are returned.
     pub fn read_temperatures(&self) -> (f32, f32) {
-        let cpu_temp = self.read_cpu_temperature().unwrap_or(0.0);
-        let gpu_temp = self.read_gpu_temperature().unwrap_or(0.0);
-        (cpu_temp, gpu_temp)
-    }
-
-    fn read_cpu_temperature(&self) -> Option<f32> {
-        // Try thermal zones
-        for i in 0..20 {
-            let type_path = format!("{}{}/type", THERMAL_ZONE_BASE, i);
-            let temp_path = format!("{}{}/temp", THERMAL_ZONE_BASE, i);
-            
-            if let Ok(zone_type) = fs::read_to_string(&type_path) {
-                let zone_type = zone_type.trim().to_lowercase();
-                if zone_type.contains("cpu") || zone_type.contains("x86_pkg") || zone_type == "acpitz" {
-                    if let Ok(temp_str) = fs::read_to_string(&temp_path) {
-                        if let Ok(temp) = temp_str.trim().parse::<f32>() {
-                            return Some(temp / 1000.0); // Convert from millidegrees
-                        }
-                    }
-                }
-            }
-        }
-
-        // Try hwmon
-        if let Some(hwmon) = self.find_hwmon_cpu() {
-            if let Ok(temp_str) = fs::read_to_string(format!("{}/temp1_input", hwmon)) {
-                if let Ok(temp) = temp_str.trim().parse::<f32>() {
-                    return Some(temp / 1000.0);
-                }
-            }
-        }
-
-        None
-    }
-
-    fn read_gpu_temperature(&self) -> Option<f32> {
-        // Try NVIDIA GPU
-        if let Some(hwmon) = self.find_hwmon_gpu() {
-            if let Ok(temp_str) = fs::read_to_string(format!("{}/temp1_input", hwmon)) {
-                if let Ok(temp) = temp_str.trim().parse::<f32>() {
-                    return Some(temp / 1000.0);
-                }
-            }
-        }
-
-        // Try AMD GPU via thermal zone
-        for i in 0..20 {
-            let type_path = format!("{}{}/type", THERMAL_ZONE_BASE, i);
-            let temp_path = format!("{}{}/temp", THERMAL_ZONE_BASE, i);
-            
-            if let Ok(zone_type) = fs::read_to_string(&type_path) {
-                let zone_type = zone_type.trim().to_lowercase();
-                if zone_type.contains("gpu") || zone_type.contains("amdgpu") {
-                    if let Ok(temp_str) = fs::read_to_string(&temp_path) {
-                        if let Ok(temp) = temp_str.trim().parse::<f32>() {
-                            return Some(temp / 1000.0);
-                        }
-                    }
-                }
-            }
-        }
-
-        None
+        let cpu_millideg = self
+            .read_thermal_zone(|zones| zones.cpu_temp_input.as_ref())
+            .or_else(|| self.read_hwmon(|hwmon| hwmon.cpu_temp_input.as_ref()));
+        let gpu_millideg = self
+            .read_hwmon(|hwmon| hwmon.gpu_temp_input.as_ref())
+            .or_else(|| self.read_thermal_zone(|zones| zones.gpu_temp_input.as_ref()));
+        (
+            millidegrees_to_celsius(cpu_millideg.unwrap_or(0)),
+            millidegrees_to_celsius(gpu_millideg.unwrap_or(0)),
+        )
     }
 
     // ==================== Fan Control ====================
@@ -209,22 +535,15 @@ impl SysfsInterface {
     }
 
     fn read_fan_rpm(&self, fan_num: u8) -> Option<u32> {
-        if let Some(hwmon) = self.find_hwmon_fan() {
-            let path = format!("{}/fan{}_input", hwmon, fan_num);
-            if let Ok(rpm_str) = fs::read_to_string(&path) {
-                if let Ok(rpm) = rpm_str.trim().parse::<u32>() {
-                    return Some(rpm);
-                }
-            }
-        }
-        None
+        let index = usize::from(fan_num).checked_sub(1)?;
+        // A dead input (asus-nb-wmi reloaded) re-scans hwmon rather than reading as no fan
+        let rpm = self.read_hwmon(|hwmon| hwmon.fan_inputs.get(index)?.as_ref())?;
+        u32::try_from(rpm).ok()
     }
 
     /// Write fan curve to hardware
     pub fn write_fan_curve(&self, curve: &FanCurve) -> ArmouryResult<()> {
-        let fan_curve_path = format!("{}/fan_curve", ASUS_WMI_PATH);
-        
-        if !Path::new(&fan_curve_path).exists() {
+        if !path_exists(FAN_CURVE_PATH) {
             return Err(ArmouryError::FeatureNotAvailable(
                 "Fan curve control not available".to_string()
             ));
@@ -232,13 +551,16 @@ impl SysfsInterface {
 
         // Format fan curve for ASUS WMI
         // Format: temp1:speed1,temp2:speed2,...
-        let curve_str: String = curve.points
-            .iter()
-            .map(|p| format!("{}:{}", p.temperature, p.fan_percent))
-            .collect::<Vec<_>>()
-            .join(",");
+        // Built in one buffer rather than a String per point plus a join
+        let mut curve_str = String::with_capacity(curve.points.len() * 8);
+        for (i, p) in curve.points.iter().enumerate() {
+            if i > 0 {
+                curve_str.push(',');
+            }
+            let _ = write!(curve_str, "{}:{}", p.temperature, p.fan_percent);
+        }
 
-        fs::write(&fan_curve_path, &curve_str).map_err(|e| {
+        self.fan_curve_writer.write(FAN_CURVE_PATH, &curve_str).map_err(|e| {
             if e.kind() == std::io::ErrorKind::PermissionDenied {
                 ArmouryError::PermissionDenied("Cannot write fan curve (root required)".to_string())
             } else {
@@ -249,10 +571,8 @@ impl SysfsInterface {
 
     /// Reset fan to automatic control
     pub fn reset_fan_auto(&self) -> ArmouryResult<()> {
-        let fan_curve_path = format!("{}/fan_curve", ASUS_WMI_PATH);
-        
-        if Path::new(&fan_curve_path).exists() {
-            fs::write(&fan_curve_path, "auto").map_err(|e| {
+        if path_exists(FAN_CURVE_PATH) {
+            self.fan_curve_writer.write(FAN_CURVE_PATH, "auto").map_err(|e| {
                 if e.kind() == std::io::ErrorKind::PermissionDenied {
                     ArmouryError::PermissionDenied("Cannot reset fan control (root required)".to_string())
                 } else {
@@ -269,17 +589,19 @@ impl SysfsInterface {
     /// Write RGB settings to hardware
     pub fn write_rgb_settings(&self, settings: &RgbSettings) -> ArmouryResult<()> {
         // Try ASUS keyboard backlight brightness
-        let kbd_backlight = "/sys/class/leds/asus::kbd_backlight/brightness";
-        if Path::new(kbd_backlight).exists() {
+        if path_exists(KBD_BACKLIGHT_BRIGHTNESS) {
             // Scale brightness to 0-3 range (typical for ASUS keyboards)
             let brightness_value = (settings.brightness as u32 * 3 / 100).min(3);
-            fs::write(kbd_backlight, brightness_value.to_string()).map_err(|e| {
-                if e.kind() == std::io::ErrorKind::PermissionDenied {
-                    ArmouryError::PermissionDenied("Cannot write keyboard brightness (root required)".to_string())
-                } else {
-                    ArmouryError::IoError(e)
-                }
-            })?;
+            let value = brightness_value.to_string();
+            self.kbd_brightness_writer
+                .write(KBD_BACKLIGHT_BRIGHTNESS, &value)
+                .map_err(|e| {
+                    if e.kind() == std::io::ErrorKind::PermissionDenied {
+                        ArmouryError::PermissionDenied("Cannot write keyboard brightness (root required)".to_string())
+                    } else {
+                        ArmouryError::IoError(e)
+                    }
+                })?;
         }
 
         // Note: Full RGB control typically requires kernel module or USB HID access
@@ -292,151 +614,545 @@ impl SysfsInterface {
 
     /// Read battery charge limit
     pub fn read_battery_limit(&self) -> Option<u8> {
-        let path = self.battery_limit_path.as_ref()?;
-        let content = fs::read_to_string(path).ok()?;
-        content.trim().parse::<u8>().ok()
+        self.read_battery().charge_limit
     }
 
     /// Write battery charge limit
     pub fn write_battery_limit(&self, limit: u8) -> ArmouryResult<()> {
-        let path = self.battery_limit_path.as_ref()
+        let path = self.battery_limit_path
             .ok_or_else(|| ArmouryError::FeatureNotAvailable(
                 "Battery charge limit not available".to_string()
             ))?;
 
-        fs::write(path, limit.to_string()).map_err(|e| {
+        let value = limit.to_string();
+        self.battery_limit_writer.write(path, &value).map_err(|e| {
             if e.kind() == std::io::ErrorKind::PermissionDenied {
                 ArmouryError::PermissionDenied("Cannot write battery limit (root required)".to_string())
             } else {
                 ArmouryError::IoError(e)
             }
+        })?;
+
+        // The cached snapshot carries the old limit
+        *self.battery_cache.lock().unwrap_or_else(|e| e.into_inner()) = None;
+        Ok(())
+    }
+
+    /// Read battery attributes, reusing a snapshot younger than the cache TTL
+    ///
+    /// The status poll and D-Bus clients often ask within the same instant;
+    /// only the first of them touches sysfs.
+    pub fn read_battery(&self) -> BatteryReadings {
+        let mut cache = self.battery_cache.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some((taken, readings)) = *cache {
+            if taken.elapsed() < BATTERY_CACHE_TTL {
+                return readings;
+            }
+        }
+
+        let readings = self.read_battery_uncached();
+        *cache = Some((Instant::now(), readings));
+        readings
+    }
+
+    /// Read battery attributes, re-scanning power supplies if a handle went stale
+    fn read_battery_uncached(&self) -> BatteryReadings {
+        self.power_supplies
+            .read_with(
+                || PowerSupplies::discover(self.battery_limit_path),
+                |supplies| self.read_battery_from(supplies).map(Some),
+            )
+            .unwrap_or_default()
+    }
+
+    /// Read battery attributes, including the charge limit, in one batched pass
+    ///
+    /// energy_now/voltage_now are skipped whenever power_now is available,
+    /// since they only feed the fallback power estimate.
+    fn read_battery_from(&self, supplies: &PowerSupplies) -> Result<BatteryReadings, StaleHandle> {
+        let inputs = supplies.battery_inputs.as_ref();
+        let [capacity, power_now, batched_limit] = match inputs {
+            Some(inputs) => read_sysfs_u64_batch(&inputs.attrs)?,
+            None => [None; 3],
+        };
+        let [energy_now, voltage_now] = match inputs {
+            Some(inputs) if power_now.is_none() => read_sysfs_u64_batch(&inputs.fallback_attrs)?,
+            _ => [None; 2],
+        };
+        let charge_limit = if supplies.battery_limit_in_batch {
+            batched_limit
+        } else {
+            self.read_battery_limit_file()
+        };
+
+        Ok(BatteryReadings {
+            capacity: capacity.map(|c| c.min(100) as u8),
+            power_now,
+            energy_now,
+            voltage_now,
+            charge_limit: charge_limit.and_then(|l| u8::try_from(l).ok()),
         })
     }
 
-    /// Read battery status (percentage, AC connected)
-    pub fn read_battery_status(&self) -> (u8, bool) {
-        let capacity = fs::read_to_string("/sys/class/power_supply/BAT0/capacity")
-            .or_else(|_| fs::read_to_string("/sys/class/power_supply/BAT1/capacity"))
-            .ok()
-            .and_then(|s| s.trim().parse::<u8>().ok())
-            .unwrap_or(0);
+    /// Read the charge limit from its own file, outside the battery batch
+    fn read_battery_limit_file(&self) -> Option<u64> {
+        read_sysfs_int(self.battery_limit_path?).and_then(|v| u64::try_from(v).ok())
+    }
+
+    /// Check whether the AC adapter is connected
+    ///
+    /// While power_supply uevents are watched the state is re-read only
+    /// after one arrives; otherwise every call reads sysfs.
+    pub fn read_ac_online(&self) -> bool {
+        if !self.power_supply_events.load(Ordering::Acquire) {
+            return self.read_ac_online_uncached();
+        }
 
-        let ac_online = fs::read_to_string("/sys/class/power_supply/AC0/online")
-            .or_else(|_| fs::read_to_string("/sys/class/power_supply/ADP0/online"))
-            .or_else(|_| fs::read_to_string("/sys/class/power_supply/ADP1/online"))
-            .ok()
-            .map(|s| s.trim() == "1")
-            .unwrap_or(false);
+        let mut cache = self.ac_online_cache.lock().unwrap_or_else(|e| e.into_inner());
+        *cache.get_or_insert_with(|| self.read_ac_online_uncached())
+    }
+
+    /// Read the adapter's `online` attribute
+    ///
+    /// Power supplies are scanned on the first call rather than at startup,
+    /// so the daemon reaches the bus without waiting on a subsystem the first
+    /// status poll will touch anyway.
+    fn read_ac_online_uncached(&self) -> bool {
+        self.power_supplies
+            .read(
+                || PowerSupplies::discover(self.battery_limit_path),
+                |supplies| supplies.ac_online_input.as_ref(),
+            )
+            .is_some_and(|online| online == 1)
+    }
+
+    /// Trust cached power supply state between uevents, or stop doing so
+    ///
+    /// Only enable this while something reports every power_supply uevent
+    /// through `power_supply_changed`.
+    pub fn watch_power_supply_events(&self, watched: bool) {
+        self.power_supply_events.store(watched, Ordering::Release);
+    }
+
+    /// Drop cached power supply state after a power_supply uevent
+    pub fn power_supply_changed(&self) {
+        *self.ac_online_cache.lock().unwrap_or_else(|e| e.into_inner()) = None;
+        *self.battery_cache.lock().unwrap_or_else(|e| e.into_inner()) = None;
+    }
 
-        (capacity, ac_online)
+    /// Forget the discovered battery and adapter after one was added or removed
+    pub fn power_supplies_hotplugged(&self) {
+        self.power_supplies.invalidate();
+        invalidate_path_cache();
+        self.power_supply_changed();
     }
 
     // ==================== System Usage ====================
 
     /// Read CPU and GPU usage percentages
     pub fn read_cpu_gpu_usage(&self) -> (f32, f32) {
-        // CPU usage requires reading /proc/stat and calculating delta
-        // For simplicity, we'll read load average as an approximation
-        let cpu_usage = self.read_cpu_usage_simple().unwrap_or(0.0);
+        let cpu_usage = self.read_cpu_usage().unwrap_or(0.0);
         let gpu_usage = self.read_gpu_usage().unwrap_or(0.0);
         (cpu_usage, gpu_usage)
     }
 
-    fn read_cpu_usage_simple(&self) -> Option<f32> {
-        // Read load average as simple CPU usage indicator
-        let loadavg = fs::read_to_string("/proc/loadavg").ok()?;
-        let load: f32 = loadavg.split_whitespace().next()?.parse().ok()?;
-        
-        // Get number of CPUs
-        let cpus = std::thread::available_parallelism()
-            .map(|n| n.get() as f32)
-            .unwrap_or(1.0);
-        
-        // Convert load to percentage (capped at 100%)
-        Some((load / cpus * 100.0).min(100.0))
+    /// CPU usage since the last measured window, from the aggregate /proc/stat line
+    ///
+    /// The monitor tick and live D-Bus reads share one baseline. A call
+    /// landing less than `MIN_CPU_USAGE_WINDOW_JIFFIES` after the last
+    /// measurement returns that measurement again and leaves the baseline
+    /// alone, so a concurrent caller neither eats the tick's window nor
+    /// reports a made-up 0%. The first call reports the average since boot.
+    fn read_cpu_usage(&self) -> Option<f32> {
+        // The aggregate "cpu" line is always first and well under 256 bytes
+        let mut buf = [0u8; 256];
+        let len = self.proc_stat.as_ref()?.read_at(&mut buf, 0).ok()?;
+        let (idle, total) = parse_cpu_times(&buf[..len])?;
+
+        let mut last = self.last_cpu_times.lock().unwrap_or_else(|e| e.into_inner());
+        let total_delta = total.saturating_sub(last.total);
+        if total_delta < MIN_CPU_USAGE_WINDOW_JIFFIES {
+            if let Some(usage) = last.usage {
+                return Some(usage);
+            }
+            if total_delta == 0 {
+                return None;
+            }
+        }
+
+        let idle_delta = idle.saturating_sub(last.idle).min(total_delta);
+        let usage = (total_delta - idle_delta) as f32 / total_delta as f32 * 100.0;
+        *last = CpuTimes {
+            idle,
+            total,
+            usage: Some(usage),
+        };
+        Some(usage)
     }
 
     fn read_gpu_usage(&self) -> Option<f32> {
         // Try NVIDIA GPU
-        if let Some(hwmon) = self.find_hwmon_gpu() {
-            // Some NVIDIA drivers expose GPU utilization
-            let util_path = format!("{}/gpu_busy_percent", hwmon);
-            if let Ok(util_str) = fs::read_to_string(&util_path) {
-                if let Ok(util) = util_str.trim().parse::<f32>() {
-                    return Some(util);
-                }
-            }
+        // Some NVIDIA drivers expose GPU utilization
+        if let Some(util) = self.read_hwmon(|hwmon| hwmon.gpu_busy_input.as_ref()) {
+            return Some(util as f32);
         }
 
         // Try AMD GPU
-        let amd_util_path = "/sys/class/drm/card0/device/gpu_busy_percent";
-        if let Ok(util_str) = fs::read_to_string(amd_util_path) {
-            if let Ok(util) = util_str.trim().parse::<f32>() {
-                return Some(util);
-            }
+        if let Some(util) = self.read_hwmon(|hwmon| hwmon.drm_busy_input.as_ref()) {
+            return Some(util as f32);
         }
 
         None
     }
 
-    /// Read power draw in watts
-    pub fn read_power_draw(&self) -> f32 {
-        // Try to read from battery power_now (in microwatts)
-        if let Ok(power_str) = fs::read_to_string("/sys/class/power_supply/BAT0/power_now") {
-            if let Ok(power) = power_str.trim().parse::<f64>() {
-                return (power / 1_000_000.0) as f32; // Convert to watts
+    // ==================== Helper Functions ====================
+
+    /// hwmon devices by role, classified by a single scan on first use
+    ///
+    /// Capability detection and every later status poll share the result
+    /// instead of each walking /sys/class/hwmon again.
+    fn hwmon_devices(&self) -> Arc<HwmonDevices> {
+        self.hwmon_devices.get(HwmonDevices::discover)
+    }
+
+    /// Read one of the kept-open hwmon attributes, re-scanning if it went stale
+    fn read_hwmon(&self, input: impl Fn(&HwmonDevices) -> Option<&fs::File>) -> Option<i64> {
+        self.hwmon_devices.read(HwmonDevices::discover, input)
+    }
+
+    /// Forget discovered sensor devices so the next read scans for them again
+    ///
+    /// Called after changes that add or remove devices, such as a GPU mode
+    /// switch powering the dGPU up or down.
+    pub fn rediscover_sensors(&self) {
+        self.hwmon_devices.invalidate();
+        self.thermal_zones.invalidate();
+        invalidate_path_cache();
+    }
+
+    /// Read a kept-open thermal zone `temp`, re-classifying zones if it went stale
+    fn read_thermal_zone(&self, input: impl Fn(&ThermalZones) -> Option<&fs::File>) -> Option<i64> {
+        self.thermal_zones.read(ThermalZones::discover, input)
+    }
+}
+
+/// CPU time baseline for delta-based usage and the usage it last produced
+#[derive(Debug, Default)]
+struct CpuTimes {
+    /// Idle jiffies (idle + iowait) at the baseline
+    idle: u64,
+    /// Total jiffies at the baseline
+    total: u64,
+    /// Usage measured over the window ending at the baseline
+    usage: Option<f32>,
+}
+
+/// Convert a sysfs millidegree reading to degrees Celsius
+fn millidegrees_to_celsius(millideg: i64) -> f32 {
+    millideg as f32 / 1000.0
+}
+
+/// Kept-open sysfs attribute written with pwrite
+///
+/// Every write reaches the firmware: the attribute may have been changed
+/// outside the daemon (hotkeys, asusctl, a profile switch) since the last
+/// one, so repeats of the same value are not skipped.
+#[derive(Debug)]
+struct SysfsWriter {
+    /// Kept-open handle, replaced when it goes stale
+    file: Mutex<Option<fs::File>>,
+}
+
+impl SysfsWriter {
+    fn new(file: Option<fs::File>) -> Self {
+        Self {
+            file: Mutex::new(file),
+        }
+    }
+
+    /// Write `value` through the kept-open handle
+    fn write(&self, path: &str, value: &str) -> std::io::Result<()> {
+        let mut file = self.file.lock().unwrap_or_else(|e| e.into_inner());
+        write_sysfs_attr(&mut file, path, value)
+    }
+}
+
+/// Open a sysfs attribute for writing, to be kept for the process lifetime
+///
+/// Returns `None` when the node is missing or not writable (e.g. when not
+/// running as root); writes then fall back to opening the path each time.
+fn open_sysfs_writer(path: &str) -> Option<fs::File> {
+    fs::OpenOptions::new()
+        .write(true)
+        .custom_flags(libc::O_NOFOLLOW)
+        .open(path)
+        .ok()
+}
+
+/// Write a value to a sysfs attribute, reusing `writer` when available
+///
+/// Sysfs stores the whole buffer on each write, so a pwrite at offset 0 on
+/// a kept-open handle replaces an open/write/close round trip. If that
+/// fails, the write is retried through the path: after an asus-nb-wmi or
+/// asus-wmi reload the kept-open handle is stale but the path is not. Once
+/// a path write succeeds, `writer` is replaced with a freshly opened handle.
+fn write_sysfs_attr(writer: &mut Option<fs::File>, path: &str, value: &str) -> std::io::Result<()> {
+    if let Some(file) = writer.as_ref() {
+        match file.write_at(value.as_bytes(), 0) {
+            Ok(_) => return Ok(()),
+            Err(e) => {
+                debug!("Write through kept-open {} failed ({}), reopening", path, e);
+                *writer = None;
             }
         }
+    }
+
+    fs::write(path, value)?;
+    if writer.is_none() {
+        *writer = open_sysfs_writer(path);
+    }
+    Ok(())
+}
+
+/// Model name from DMI, falling back to the ASUS WMI device
+fn read_model_name_uncached() -> Option<String> {
+    // Try DMI product name
+    if let Ok(name) = fs::read_to_string("/sys/class/dmi/id/product_name") {
+        let name = name.trim().to_string();
+        if !name.is_empty() {
+            return Some(name);
+        }
+    }
+
+    // Try ASUS WMI
+    let wmi_path = format!("{}/product_name", ASUS_WMI_PATH);
+    if let Ok(name) = fs::read_to_string(&wmi_path) {
+        let name = name.trim().to_string();
+        if !name.is_empty() {
+            return Some(name);
+        }
+    }
+
+    None
+}
+
+/// Name written to platform_profile for a performance mode
+fn platform_profile_name(mode: PerformanceMode) -> &'static str {
+    match mode {
+        PerformanceMode::Silent => "quiet",
+        PerformanceMode::Balanced => "balanced",
+        PerformanceMode::Turbo => "performance",
+        PerformanceMode::Manual => "balanced", // Manual uses balanced as base
+    }
+}
+
+/// Performance mode for a platform_profile value
+fn parse_platform_profile(profile: &str) -> Option<PerformanceMode> {
+    match profile {
+        "quiet" | "silent" => Some(PerformanceMode::Silent),
+        "balanced" | "balanced-performance" => Some(PerformanceMode::Balanced),
+        "performance" | "turbo" => Some(PerformanceMode::Turbo),
+        _ => None,
+    }
+}
 
-        // Try energy_now approach
-        if let Ok(energy_str) = fs::read_to_string("/sys/class/power_supply/BAT0/energy_now") {
-            if let Ok(voltage_str) = fs::read_to_string("/sys/class/power_supply/BAT0/voltage_now") {
-                if let (Ok(energy), Ok(voltage)) = (
-                    energy_str.trim().parse::<f64>(),
-                    voltage_str.trim().parse::<f64>()
-                ) {
-                    // This is approximate - actual power draw requires time delta
-                    return ((energy * voltage) / 1e12) as f32;
+/// Find the system battery and the mains adapter with a single directory scan
+///
+/// Returns the battery directory (lowest-numbered `BAT*` of type Battery) and
+/// the `online` attribute of the first supply of type Mains, whatever the
+/// firmware happened to name it.
+fn discover_power_supplies() -> (Option<PathBuf>, Option<PathBuf>) {
+    let mut battery: Option<PathBuf> = None;
+    let mut ac_online = None;
+
+    let entries = match fs::read_dir(POWER_SUPPLY_PATH) {
+        Ok(entries) => entries,
+        Err(_) => return (None, None),
+    };
+
+    for entry in entries.flatten() {
+        let path = entry.path();
+        let supply_type = match fs::read_to_string(path.join("type")) {
+            Ok(t) => t,
+            Err(_) => continue,
+        };
+
+        match supply_type.trim() {
+            "Battery" if entry.file_name().to_string_lossy().starts_with("BAT") => {
+                let is_lowest = match &battery {
+                    Some(current) => path < *current,
+                    None => true,
+                };
+                if is_lowest {
+                    battery = Some(path);
                 }
             }
+            "Mains" if ac_online.is_none() => ac_online = Some(path.join("online")),
+            _ => {}
         }
-
-        0.0
     }
 
-    // ==================== Helper Functions ====================
+    debug!("Power supplies: battery={:?}, ac={:?}", battery, ac_online);
+    (battery, ac_online)
+}
 
-    fn find_hwmon_cpu(&self) -> Option<String> {
-        self.find_hwmon_by_name(&["coretemp", "k10temp", "zenpower", "acpitz"])
+/// Read several kept-open numeric attributes in one pass.
+///
+/// Each attribute costs a single pread into a stack buffer; there is no
+/// path lookup, open or close per poll.
+fn read_sysfs_u64_batch<const N: usize>(
+    inputs: &[Option<fs::File>; N],
+) -> Result<[Option<u64>; N], StaleHandle> {
+    let mut values = [None; N];
+    for (value, input) in values.iter_mut().zip(inputs) {
+        if let Some(file) = input {
+            *value = read_kept_open_int(file)?.and_then(|v| u64::try_from(v).ok());
+        }
     }
+    Ok(values)
+}
 
-    fn find_hwmon_gpu(&self) -> Option<String> {
-        self.find_hwmon_by_name(&["nvidia", "amdgpu", "nouveau", "radeon"])
+/// Open a numeric sysfs attribute for repeated pread polling
+fn open_sysfs_reader(path: impl AsRef<Path>) -> Option<fs::File> {
+    fs::File::open(path).ok()
+}
+
+/// Read a numeric sysfs attribute without decoding it to a String
+fn read_sysfs_int(path: impl AsRef<Path>) -> Option<i64> {
+    // Numeric attributes are a few bytes; sysfs returns them in a single read
+    let mut buf = [0u8; 32];
+    let len = fs::File::open(path)
+        .and_then(|mut f| f.read(&mut buf))
+        .ok()?;
+    parse_sysfs_int(&buf[..len])
+}
+
+/// A kept-open sysfs handle whose node has been removed
+#[derive(Debug)]
+struct StaleHandle;
+
+/// Re-read a kept-open numeric sysfs attribute
+///
+/// A pread at offset 0 makes sysfs regenerate the value, so the poll costs
+/// one syscall instead of open/read/close. Once its node is gone (driver
+/// unloaded, device powered off) a handle fails every read with ENODEV;
+/// any other read error (e.g. EIO from the firmware) just yields `None`.
+fn read_kept_open_int(file: &fs::File) -> Result<Option<i64>, StaleHandle> {
+    let mut buf = [0u8; 32];
+    match file.read_at(&mut buf, 0) {
+        Ok(len) => Ok(parse_sysfs_int(&buf[..len])),
+        Err(e) if matches!(e.raw_os_error(), Some(libc::ENODEV | libc::ENOENT | libc::ENXIO)) => {
+            Err(StaleHandle)
+        }
+        Err(_) => Ok(None),
     }
+}
 
-    fn find_hwmon_fan(&self) -> Option<String> {
-        self.find_hwmon_by_name(&["asus-nb-wmi", "asus_fan", "thinkpad"])
+/// Parse a decimal integer from raw sysfs bytes, ignoring surrounding whitespace
+fn parse_sysfs_int(raw: &[u8]) -> Option<i64> {
+    let start = raw.iter().position(|b| !b.is_ascii_whitespace())?;
+    let end = raw.iter().rposition(|b| !b.is_ascii_whitespace())? + 1;
+    let raw = &raw[start..end];
+    let (negative, digits) = match raw.split_first()? {
+        (b'-', rest) => (true, rest),
+        _ => (false, raw),
+    };
+    if digits.is_empty() {
+        return None;
     }
 
-    fn find_hwmon_by_name(&self, names: &[&str]) -> Option<String> {
-        let hwmon_dir = Path::new(HWMON_PATH);
-        if !hwmon_dir.exists() {
+    let mut value: i64 = 0;
+    for &b in digits {
+        if !b.is_ascii_digit() {
             return None;
         }
+        value = value.checked_mul(10)?.checked_add(i64::from(b - b'0'))?;
+    }
+    Some(if negative { -value } else { value })
+}
 
-        if let Ok(entries) = fs::read_dir(hwmon_dir) {
-            for entry in entries.flatten() {
-                let path = entry.path();
-                let name_path = path.join("name");
-                if let Ok(name) = fs::read_to_string(&name_path) {
-                    let name = name.trim().to_lowercase();
-                    if names.iter().any(|n| name.contains(n)) {
-                        return Some(path.to_string_lossy().to_string());
-                    }
+/// Parse the aggregate "cpu" line of /proc/stat into (idle, total) jiffies
+///
+/// Idle includes iowait; total covers user through steal (guest time is
+/// already accounted in user/nice).
+fn parse_cpu_times(stat: &[u8]) -> Option<(u64, u64)> {
+    // Scanned byte by byte: no UTF-8 validation, no per-field str::parse
+    let rest = stat.strip_prefix(b"cpu ")?;
+
+    let mut times = [0u64; 8];
+    let mut field = 0;
+    let mut in_digits = false;
+    for &b in rest {
+        match b {
+            b'0'..=b'9' => {
+                times[field] = times[field].checked_mul(10)?.checked_add(u64::from(b - b'0'))?;
+                in_digits = true;
+            }
+            b' ' if in_digits => {
+                field += 1;
+                in_digits = false;
+                if field == times.len() {
+                    break;
                 }
             }
+            b' ' => {}
+            _ => break,
         }
+    }
+    if field + usize::from(in_digits) < times.len() {
+        return None;
+    }
 
-        None
+    let idle = times[3] + times[4];
+    Some((idle, times.iter().sum()))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn parse_sysfs_int_trims_whitespace() {
+        assert_eq!(parse_sysfs_int(b"42\n"), Some(42));
+        assert_eq!(parse_sysfs_int(b"  7\n"), Some(7));
+        assert_eq!(parse_sysfs_int(b"\t-1500 \n"), Some(-1500));
+        assert_eq!(parse_sysfs_int(b"0"), Some(0));
+    }
+
+    #[test]
+    fn parse_sysfs_int_rejects_malformed_input() {
+        assert_eq!(parse_sysfs_int(b""), None);
+        assert_eq!(parse_sysfs_int(b" \n"), None);
+        assert_eq!(parse_sysfs_int(b"-"), None);
+        assert_eq!(parse_sysfs_int(b"-\n"), None);
+        assert_eq!(parse_sysfs_int(b"1 2"), None);
+        assert_eq!(parse_sysfs_int(b"12a"), None);
+        assert_eq!(parse_sysfs_int(b"+5"), None);
+        assert_eq!(parse_sysfs_int(b"9223372036854775807"), Some(i64::MAX));
+        assert_eq!(parse_sysfs_int(b"9223372036854775808"), None);
+        assert_eq!(parse_sysfs_int(b"99999999999999999999\n"), None);
+    }
+
+    #[test]
+    fn parse_cpu_times_sums_fields() {
+        // user nice system idle iowait irq softirq steal guest guest_nice
+        let stat = b"cpu  100 20 30 400 50 6 7 8 9 10\ncpu0 50 10 15 200 25 3 3 4 4 5\n";
+        assert_eq!(parse_cpu_times(stat), Some((450, 621)));
+    }
+
+    #[test]
+    fn parse_cpu_times_handles_exactly_eight_fields() {
+        assert_eq!(parse_cpu_times(b"cpu 1 2 3 4 5 6 7 8\n"), Some((9, 36)));
+        assert_eq!(parse_cpu_times(b"cpu 1 2 3 4 5 6 7 8"), Some((9, 36)));
+    }
+
+    #[test]
+    fn parse_cpu_times_rejects_short_or_foreign_lines() {
+        assert_eq!(parse_cpu_times(b"cpu  1 2 3 4 5 6 7\n"), None);
+        assert_eq!(parse_cpu_times(b"cpu \n"), None);
+        assert_eq!(parse_cpu_times(b""), None);
+        assert_eq!(parse_cpu_times(b"cpu0 1 2 3 4 5 6 7 8\n"), None);
+        assert_eq!(parse_cpu_times(b"intr 1 2 3 4 5 6 7 8\n"), None);
+        assert_eq!(parse_cpu_times(b"cpu  99999999999999999999 0 0 0 0 0 0 0\n"), None);
     }
 }
@@ -0,0 +1,210 @@
+//! Kernel uevent notifications for power supply changes
+//!
+//! The kernel broadcasts a uevent whenever a power supply changes state
+//! (AC plugged or unplugged, battery status updates). Listening for them lets
+//! the daemon trust cached power supply readings in between, instead of
+//! re-reading sysfs on every poll just to notice a change.
+
+use std::io;
+use std::mem;
+use std::os::fd::{AsRawFd, FromRawFd, OwnedFd};
+
+use tokio::io::unix::AsyncFd;
+
+/// Multicast group the kernel itself sends uevents to (udev uses group 2)
+const KERNEL_UEVENT_GROUP: u32 = 1;
+
+/// Field identifying power supply uevents
+const POWER_SUPPLY_SUBSYSTEM: &[u8] = b"SUBSYSTEM=power_supply";
+
+/// Receive buffer requested for the socket (bytes)
+///
+/// The socket sees uevents from every subsystem; boot, resume and
+/// `udevadm trigger` send them in bursts the default buffer can't hold.
+const RECV_BUFFER_SIZE: libc::c_int = 4 * 1024 * 1024;
+
+/// Prefix of the field carrying the uevent action
+const ACTION_PREFIX: &[u8] = b"ACTION=";
+
+/// What a power_supply uevent reported
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum PowerSupplyChange {
+    /// An existing supply changed state (AC plugged, battery status update)
+    Changed,
+    /// A supply was registered or unregistered (late ACPI, battery hot-swap)
+    Hotplug,
+}
+
+/// Non-blocking NETLINK_KOBJECT_UEVENT socket, registered with the runtime
+pub struct PowerSupplyEvents {
+    socket: AsyncFd<OwnedFd>,
+}
+
+impl PowerSupplyEvents {
+    /// Subscribe to kernel uevents
+    pub fn open() -> io::Result<Self> {
+        // SAFETY: plain socket(2) call; the result is checked before use
+        let fd = unsafe {
+            libc::socket(
+                libc::AF_NETLINK,
+                libc::SOCK_DGRAM | libc::SOCK_NONBLOCK | libc::SOCK_CLOEXEC,
+                libc::NETLINK_KOBJECT_UEVENT,
+            )
+        };
+        if fd < 0 {
+            return Err(io::Error::last_os_error());
+        }
+        // SAFETY: fd is a freshly created socket owned by nothing else
+        let fd = unsafe { OwnedFd::from_raw_fd(fd) };
+
+        // SAFETY: sockaddr_nl is plain data, valid when zeroed
+        let mut addr: libc::sockaddr_nl = unsafe { mem::zeroed() };
+        addr.nl_family = libc::AF_NETLINK as libc::sa_family_t;
+        addr.nl_groups = KERNEL_UEVENT_GROUP;
+        // SAFETY: addr is a valid sockaddr_nl and the length matches it
+        let ret = unsafe {
+            libc::bind(
+                fd.as_raw_fd(),
+                &addr as *const libc::sockaddr_nl as *const libc::sockaddr,
+                mem::size_of::<libc::sockaddr_nl>() as libc::socklen_t,
+            )
+        };
+        if ret < 0 {
+            return Err(io::Error::last_os_error());
+        }
+
+        // SO_RCVBUFFORCE can go past rmem_max but needs CAP_NET_ADMIN;
+        // either way a smaller buffer only means more ENOBUFS, not failure
+        if set_recv_buffer(&fd, libc::SO_RCVBUFFORCE).is_err() {
+            let _ = set_recv_buffer(&fd, libc::SO_RCVBUF);
+        }
+
+        Ok(Self { socket: AsyncFd::new(fd)? })
+    }
+
+    /// Wait for the next power_supply uevent, discarding all others
+    ///
+    /// An overrun socket (ENOBUFS) reports `Hotplug`, since whatever was
+    /// dropped may have included supplies coming or going; the socket
+    /// keeps working afterwards.
+    pub async fn changed(&self) -> io::Result<PowerSupplyChange> {
+        // Uevents are a few hundred bytes of NUL-separated KEY=VALUE fields
+        let mut buf = [0u8; 4096];
+        loop {
+            let mut guard = self.socket.readable().await?;
+            let len = match guard.try_io(|socket| recv(socket.get_ref(), &mut buf)) {
+                Ok(Ok(len)) => len,
+                Ok(Err(e)) if e.raw_os_error() == Some(libc::ENOBUFS) => {
+                    return Ok(PowerSupplyChange::Hotplug);
+                }
+                Ok(Err(e)) => return Err(e),
+                Err(_would_block) => continue,
+            };
+            if let Some(change) = parse_power_supply_event(&buf[..len]) {
+                return Ok(change);
+            }
+        }
+    }
+}
+
+/// Set the socket's receive buffer size through `option`
+fn set_recv_buffer(socket: &OwnedFd, option: libc::c_int) -> io::Result<()> {
+    // SAFETY: the value is a c_int and the length matches it
+    let ret = unsafe {
+        libc::setsockopt(
+            socket.as_raw_fd(),
+            libc::SOL_SOCKET,
+            option,
+            &RECV_BUFFER_SIZE as *const libc::c_int as *const libc::c_void,
+            mem::size_of::<libc::c_int>() as libc::socklen_t,
+        )
+    };
+    if ret < 0 {
+        Err(io::Error::last_os_error())
+    } else {
+        Ok(())
+    }
+}
+
+/// Receive one datagram without blocking
+fn recv(socket: &OwnedFd, buf: &mut [u8]) -> io::Result<usize> {
+    // SAFETY: buf is valid for writes of buf.len() bytes
+    let len = unsafe {
+        libc::recv(socket.as_raw_fd(), buf.as_mut_ptr().cast(), buf.len(), 0)
+    };
+    if len < 0 {
+        Err(io::Error::last_os_error())
+    } else {
+        Ok(len as usize)
+    }
+}
+
+/// Classify a raw uevent message, or `None` if it is not a power_supply one
+fn parse_power_supply_event(msg: &[u8]) -> Option<PowerSupplyChange> {
+    let mut power_supply = false;
+    let mut change = PowerSupplyChange::Changed;
+    for field in msg.split(|&b| b == 0) {
+        if field == POWER_SUPPLY_SUBSYSTEM {
+            power_supply = true;
+        } else if let Some(action) = field.strip_prefix(ACTION_PREFIX) {
+            if action == b"add" || action == b"remove" {
+                change = PowerSupplyChange::Hotplug;
+            }
+        }
+    }
+    power_supply.then_some(change)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Build a raw uevent message from its header and fields
+    fn message(fields: &[&str]) -> Vec<u8> {
+        let mut msg = Vec::new();
+        for field in fields {
+            msg.extend_from_slice(field.as_bytes());
+            msg.push(0);
+        }
+        msg
+    }
+
+    #[test]
+    fn power_supply_change_is_not_hotplug() {
+        let msg = message(&[
+            "change@/devices/LNXSYSTM:00/ACPI0003:00/power_supply/AC0",
+            "ACTION=change",
+            "SUBSYSTEM=power_supply",
+            "POWER_SUPPLY_ONLINE=1",
+        ]);
+        assert_eq!(parse_power_supply_event(&msg), Some(PowerSupplyChange::Changed));
+    }
+
+    #[test]
+    fn power_supply_add_and_remove_are_hotplug() {
+        for action in ["ACTION=add", "ACTION=remove"] {
+            let msg = message(&["x@/devices/BAT1", action, "SUBSYSTEM=power_supply"]);
+            assert_eq!(parse_power_supply_event(&msg), Some(PowerSupplyChange::Hotplug));
+        }
+        // Field order does not matter
+        let msg = message(&["add@/devices/BAT1", "SUBSYSTEM=power_supply", "ACTION=add"]);
+        assert_eq!(parse_power_supply_event(&msg), Some(PowerSupplyChange::Hotplug));
+    }
+
+    #[test]
+    fn other_subsystems_are_ignored() {
+        for action in ["ACTION=add", "ACTION=remove", "ACTION=change"] {
+            let msg = message(&["x@/devices/pci0000:00", action, "SUBSYSTEM=pci"]);
+            assert_eq!(parse_power_supply_event(&msg), None);
+        }
+        let msg = message(&["add@/devices/x", "ACTION=add", "SUBSYSTEM=power_supply_extra"]);
+        assert_eq!(parse_power_supply_event(&msg), None);
+        assert_eq!(parse_power_supply_event(b""), None);
+    }
+
+    #[test]
+    fn missing_action_counts_as_change() {
+        let msg = message(&["change@/devices/BAT0", "SUBSYSTEM=power_supply"]);
+        assert_eq!(parse_power_supply_event(&msg), Some(PowerSupplyChange::Changed));
+    }
+}
@@ -3,9 +3,13 @@
 //! Background service providing hardware control for ASUS laptops via D-Bus.
 
 use anyhow::Result;
-use log::{info, warn};
+use asus_armoury_common::SystemStatus;
+use log::{debug, info, warn};
 use std::sync::Arc;
+use std::time::Duration;
+use tokio::signal::unix::{signal, SignalKind};
 use tokio::sync::RwLock;
+use tokio::time::{Instant, Interval, MissedTickBehavior};
 
 mod config;
 mod hardware;
@@ -13,14 +17,29 @@ mod dbus_server;
 mod profiles;
 
 use config::DaemonConfig;
-use hardware::HardwareController;
+use hardware::{HardwareController, PowerSupplyChange, PowerSupplyEvents};
 use profiles::ProfileManager;
 
+/// Consecutive unchanged samples before the poll interval is stretched
+const IDLE_TICKS_BEFORE_BACKOFF: u32 = 5;
+
+/// Longest poll interval reached while the system is idle
+const MAX_IDLE_POLL_INTERVAL: Duration = Duration::from_secs(5);
+
+/// Width of the CPU/GPU usage buckets compared between samples (percent)
+const USAGE_BUCKET_PERCENT: f32 = 5.0;
+
+/// Width of the fan speed buckets compared between samples (RPM)
+const FAN_BUCKET_RPM: u32 = 100;
+
 /// Application state shared between D-Bus handlers
 pub struct AppState {
     pub hardware: HardwareController,
     pub profiles: ProfileManager,
     pub config: DaemonConfig,
+    /// JSON of the latest status sample and when it was taken, refreshed by
+    /// the monitoring task
+    pub status_json: Option<(std::time::Instant, String)>,
 }
 
 impl AppState {
@@ -33,11 +52,16 @@ impl AppState {
             hardware,
             profiles,
             config,
+            status_json: None,
         })
     }
 }
 
-#[tokio::main]
+// Everything async on this runtime is I/O-bound waiting (poll tick,
+// uevents, signals); zbus serves D-Bus calls from its own async-io
+// executor thread, and blocking sysfs reads go to the blocking pool, so
+// one runtime thread is enough.
+#[tokio::main(flavor = "current_thread")]
 async fn main() -> Result<()> {
     // Initialize logging
     env_logger::Builder::from_env(
@@ -56,6 +80,7 @@ async fn main() -> Result<()> {
                 hardware: HardwareController::dummy(),
                 profiles: ProfileManager::default(),
                 config: DaemonConfig::default(),
+                status_json: None,
             }))
         }
     };
@@ -80,21 +105,167 @@ async fn main() -> Result<()> {
     
     // Clone state for the monitoring task
     let monitor_state = state.clone();
-    
+    let poll_interval = Duration::from_millis(state.read().await.config.poll_interval_ms.max(1));
+
     // Start system monitoring task
-    tokio::spawn(async move {
-        loop {
-            tokio::time::sleep(tokio::time::Duration::from_secs(2)).await;
-            
-            // Update system status periodically
-            let state_guard = monitor_state.read().await;
-            let _status = state_guard.hardware.get_system_status();
-            // Status is now available for D-Bus queries
-        }
-    });
-    
-    // Run D-Bus server (blocks)
-    dbus_server::run_server(state).await?;
+    tokio::spawn(monitor_system(monitor_state, poll_interval));
+
+    // Run D-Bus server until SIGTERM/SIGINT. Both are waited on alongside
+    // the server, so shutdown is immediate instead of on a sleep boundary.
+    let mut sigterm = signal(SignalKind::terminate())?;
+    tokio::select! {
+        result = dbus_server::run_server(state) => result?,
+        _ = sigterm.recv() => info!("Received SIGTERM, shutting down"),
+        _ = tokio::signal::ctrl_c() => info!("Received SIGINT, shutting down"),
+    }
 
     Ok(())
 }
+
+/// Sample system status on a fixed cadence and publish it for D-Bus clients
+///
+/// After `IDLE_TICKS_BEFORE_BACKOFF` samples with the same `activity_key`,
+/// the period doubles up to `MAX_IDLE_POLL_INTERVAL`; any change, including
+/// a power_supply uevent, drops it straight back to `poll_interval`.
+async fn monitor_system(state: Arc<RwLock<AppState>>, poll_interval: Duration) {
+    let max_interval = MAX_IDLE_POLL_INTERVAL.max(poll_interval);
+    let mut interval = poll_interval;
+    let mut ticker = poll_ticker(Instant::now(), interval);
+    let mut idle_ticks = 0u32;
+    let mut last_activity = None;
+
+    // AC state only changes with a power_supply uevent, so while those
+    // are watched the polls below serve it from memory
+    let mut power_events = match PowerSupplyEvents::open() {
+        Ok(events) => {
+            state.read().await.hardware.watch_power_supply_events(true);
+            Some(events)
+        }
+        Err(e) => {
+            warn!("Power supply uevents unavailable, polling AC state: {}", e);
+            None
+        }
+    };
+
+    loop {
+        tokio::select! {
+            _ = ticker.tick() => {}
+            event = power_supply_event(power_events.as_ref()) => {
+                let state_guard = state.read().await;
+                let change = match event {
+                    Ok(change) => change,
+                    Err(e) => {
+                        // Without events the cached AC state could go stale
+                        warn!("Lost power supply uevents, polling AC state: {}", e);
+                        state_guard.hardware.watch_power_supply_events(false);
+                        power_events = None;
+                        // Whatever was missed may include supplies coming or going
+                        PowerSupplyChange::Hotplug
+                    }
+                };
+                state_guard.hardware.power_supply_changed(change);
+
+                // Sample the change right away rather than after a backed-off tick
+                idle_ticks = 0;
+                if interval != poll_interval {
+                    interval = poll_interval;
+                    ticker = poll_ticker(Instant::now(), interval);
+                }
+                continue;
+            }
+        }
+
+        // Update system status periodically. The sysfs reads block, so
+        // they run on the blocking pool rather than on this single runtime
+        // thread, where they would hold up the ticker and the uevent
+        // select! above; awaiting the sample before the next tick keeps at
+        // most one in flight.
+        let sample_state = state.clone();
+        let sample = tokio::task::spawn_blocking(move || {
+            let status = sample_state.blocking_read().hardware.get_system_status();
+            serde_json::to_string(&status).map(|json| (activity_key(&status), json))
+        });
+        let (activity, status_json) = match sample.await {
+            Ok(Ok(sample)) => sample,
+            Ok(Err(e)) => {
+                warn!("Failed to serialize system status: {}", e);
+                continue;
+            }
+            Err(e) => {
+                warn!("System status poll failed: {}", e);
+                continue;
+            }
+        };
+        // Published for GetSystemStatus, so D-Bus clients don't trigger
+        // sensor reads of their own while the sample is fresh
+        state.write().await.status_json = Some((std::time::Instant::now(), status_json));
+
+        if last_activity.replace(activity) == Some(activity) {
+            idle_ticks = idle_ticks.saturating_add(1);
+        } else {
+            idle_ticks = 0;
+        }
+        let wanted = if idle_ticks >= IDLE_TICKS_BEFORE_BACKOFF {
+            (interval * 2).min(max_interval)
+        } else {
+            poll_interval
+        };
+        if wanted != interval {
+            debug!("Poll interval now {:?}", wanted);
+            interval = wanted;
+            idle_ticks = 0;
+            ticker = poll_ticker(Instant::now() + interval, interval);
+        }
+    }
+}
+
+/// Interval ticking every `period` from `start`
+///
+/// Ticks are scheduled from fixed deadlines, so slow polls don't accumulate
+/// drift; ticks missed during an overrun are skipped rather than replayed
+/// back to back.
+fn poll_ticker(start: Instant, period: Duration) -> Interval {
+    let mut ticker = tokio::time::interval_at(start, period);
+    ticker.set_missed_tick_behavior(MissedTickBehavior::Skip);
+    ticker
+}
+
+/// What has to stay the same for a sample to count as idle
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+struct ActivityKey {
+    cpu_temp: i32,
+    gpu_temp: i32,
+    cpu_usage: u32,
+    gpu_usage: u32,
+    cpu_fan: u32,
+    gpu_fan: u32,
+    battery_percent: u8,
+    ac_connected: bool,
+}
+
+/// Bucket a status sample for idle detection
+///
+/// Every figure clients display is included, so a steady temperature under
+/// a changing load keeps the poll rate up. Temperatures are compared in
+/// whole degrees, usage and fan speed in coarse buckets, so sensor noise
+/// alone does not.
+fn activity_key(status: &SystemStatus) -> ActivityKey {
+    ActivityKey {
+        cpu_temp: status.cpu_temp.round() as i32,
+        gpu_temp: status.gpu_temp.round() as i32,
+        cpu_usage: (status.cpu_usage / USAGE_BUCKET_PERCENT) as u32,
+        gpu_usage: (status.gpu_usage / USAGE_BUCKET_PERCENT) as u32,
+        cpu_fan: status.cpu_fan_rpm / FAN_BUCKET_RPM,
+        gpu_fan: status.gpu_fan_rpm / FAN_BUCKET_RPM,
+        battery_percent: status.battery_percent,
+        ac_connected: status.ac_connected,
+    }
+}
+
+/// Next power_supply uevent, or never when uevents are not being watched
+async fn power_supply_event(events: Option<&PowerSupplyEvents>) -> std::io::Result<PowerSupplyChange> {
+    match events {
+        Some(events) => events.changed().await,
+        None => std::future::pending().await,
+    }
+}
@@ -6,7 +6,7 @@ use std::collections::HashMap;
 use std::fs;
 use std::path::PathBuf;
 
-use crate::config::DaemonConfig;
+use crate::config::{write_file_atomic, DaemonConfig};
 
 /// Profile manager handling loading, saving, and applying profiles
 pub struct ProfileManager {
@@ -130,17 +130,18 @@ impl ProfileManager {
 
     /// Load profiles from disk
     fn load_profiles(&mut self) -> ArmouryResult<()> {
-        if !self.profiles_dir.exists() {
-            return Ok(());
-        }
+        let entries = match fs::read_dir(&self.profiles_dir) {
+            Ok(entries) => entries,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(()),
+            Err(e) => return Err(e.into()),
+        };
 
-        let entries = fs::read_dir(&self.profiles_dir)?;
-        
         for entry in entries.flatten() {
             let path = entry.path();
             if path.extension().map(|e| e == "json").unwrap_or(false) {
-                if let Ok(content) = fs::read_to_string(&path) {
-                    if let Ok(profile) = serde_json::from_str::<Profile>(&content) {
+                // Parse the raw bytes; serde_json validates UTF-8 as it goes
+                if let Ok(content) = fs::read(&path) {
+                    if let Ok(profile) = serde_json::from_slice::<Profile>(&content) {
                         info!("Loaded profile: {}", profile.name);
                         self.profiles.insert(profile.name.clone(), profile);
                     }
@@ -162,9 +163,9 @@ impl ProfileManager {
     /// Save a single profile to disk
     fn save_profile_to_disk(&self, profile: &Profile) -> ArmouryResult<()> {
         let path = self.profiles_dir.join(format!("{}.json", profile.name));
-        let content = serde_json::to_string_pretty(profile)
+        let content = serde_json::to_vec_pretty(profile)
             .map_err(|e| ArmouryError::ConfigError(format!("Failed to serialize profile: {}", e)))?;
-        fs::write(&path, content)?;
+        write_file_atomic(&path, &content)?;
         Ok(())
     }
 
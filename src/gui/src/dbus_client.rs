@@ -25,10 +25,12 @@ trait Armoury {
     fn set_gpu_mode(&self, mode: &str) -> Result<bool>;
     
     fn get_fan_speeds(&self) -> Result<String>;
+    fn get_fan_speeds_raw(&self) -> Result<(u32, u32)>;
     fn set_fan_curve(&self, curve_json: &str) -> Result<bool>;
     fn reset_fan_auto(&self) -> Result<bool>;
     
     fn get_temperatures(&self) -> Result<String>;
+    fn get_temperatures_raw(&self) -> Result<(f64, f64)>;
     
     fn get_rgb_settings(&self) -> Result<String>;
     fn set_rgb_settings(&self, settings_json: &str) -> Result<bool>;
@@ -126,20 +128,13 @@ impl DaemonClient {
 
     /// Get fan speeds
     pub async fn get_fan_speeds(&self) -> Option<(u32, u32)> {
-        let json = self.proxy.as_ref()?.get_fan_speeds().await.ok()?;
-        let v: serde_json::Value = serde_json::from_str(&json).ok()?;
-        let cpu = v["cpu"].as_u64()? as u32;
-        let gpu = v["gpu"].as_u64()? as u32;
-        Some((cpu, gpu))
+        self.proxy.as_ref()?.get_fan_speeds_raw().await.ok()
     }
 
     /// Get temperatures
     pub async fn get_temperatures(&self) -> Option<(f32, f32)> {
-        let json = self.proxy.as_ref()?.get_temperatures().await.ok()?;
-        let v: serde_json::Value = serde_json::from_str(&json).ok()?;
-        let cpu = v["cpu"].as_f64()? as f32;
-        let gpu = v["gpu"].as_f64()? as f32;
-        Some((cpu, gpu))
+        let (cpu, gpu) = self.proxy.as_ref()?.get_temperatures_raw().await.ok()?;
+        Some((cpu as f32, gpu as f32))
     }
 
     /// Get RGB settings